@@ -3,10 +3,19 @@ import base64
 import os
 import zlib
 
-from .exceptions import *
+from .exceptions import (
+    FileDelException,
+    FileGetException,
+    FilePutException,
+    OfflinePeer,
+)
 from components.logs import logger
 from components.utils.misc import is_path_within_cwd
 from components.utils.files import apply_meta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .server import Server
 
 
 class Files:
@@ -140,32 +149,31 @@ class Files:
 
         async def _send_file_to_peer(peer, file):
             try:
-                async with sem:
-                    await self.fileput(file, file, peer)
+                await self.fileput(file, file, peer)
             except FilePutException as e:
                 logger.warning(f"Cannot send to {peer}: {e}")
 
+        async def _send_files(jobs):
+            # A fixed set of workers drains the shared iterator, instead of one
+            # task per file and peer waiting on a semaphore
+            async def _worker():
+                for peer, file in jobs:
+                    await _send_file_to_peer(peer, file)
+
+            await asyncio.gather(*(_worker() for _ in range(20)))
+
         if not is_path_within_cwd(folder):
             raise ValueError("Folder not within working directory")
 
-        sem = asyncio.Semaphore(20)
-
         files = [f for f in _list_real_files(folder)]
         peers = list(self.cluster.peers.get_established())
+        jobs = iter([(peer, file) for file in files for peer in peers])
 
         if in_background:
-            for file in files:
-                for peer in peers:
-                    t = asyncio.create_task(_send_file_to_peer(peer, file))
-                    t.add_done_callback(
-                        lambda _t: _t.exception() and logger.critical(_t.exception())
-                    )
+            t = asyncio.create_task(_send_files(jobs))
+            t.add_done_callback(
+                lambda _t: _t.exception() and logger.critical(_t.exception())
+            )
             return
 
-        tasks = [
-            asyncio.create_task(_send_file_to_peer(peer, file))
-            for file in files
-            for peer in peers
-        ]
-
-        await asyncio.gather(*tasks, return_exceptions=False)
+        await _send_files(jobs)
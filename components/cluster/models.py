@@ -2,7 +2,7 @@ import asyncio
 import re
 
 from components.utils.datetimes import ntime_utc_now
-from components.utils.misc import unique_list, ensure_list
+from components.utils.misc import ensure_unique_list
 from config import defaults
 from dataclasses import dataclass, field
 from enum import Enum, auto
@@ -118,7 +118,7 @@ class LocalPeer:
         if not re.fullmatch(r"^[a-zA-Z0-9\-_\.]+$", self.name) or len(self.name) < 3:
             raise ValueError(f"'{self.name}' is not a valid name")
 
-        self.cli_bindings = unique_list(ensure_list(self.cli_bindings))
+        self.cli_bindings = ensure_unique_list(self.cli_bindings)
 
         for ip in self.cli_bindings:
             if ip == self.ip4 or ip == self.ip6:
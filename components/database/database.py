@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import zlib
 import base64
@@ -10,15 +11,16 @@ from collections import OrderedDict
 from components.cluster.exceptions import ClusterException
 from components.cluster.models import ClusterState
 from components.database.helpers import (
+    compile_clause,
     create_sort_key,
     filter_rows,
     get_all,
-    match_clause,
+    match_compiled_clause,
     merge_dict,
     paginate_rows,
 )
 from components.logs import logger
-from components.utils.misc import ensure_list
+from components.utils.misc import ensure_list, json_dumps, json_loads
 from functools import wraps
 from pathlib import Path
 from typing import Any, Dict, List, Set, Tuple
@@ -82,14 +84,14 @@ class StorageCodec:
         if self.kind == "msgpack":
             return msgpack.dumps(obj, use_bin_type=True)
         elif self.kind == "json":
-            return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+            return json_dumps(obj)
         raise ValueError(f"Unknown codec: {self.kind}")
 
     def loads(self, data: bytes) -> dict:
         if self.kind == "msgpack":
             return msgpack.loads(data, raw=False)
         elif self.kind == "json":
-            return json.loads(data.decode("utf-8"))
+            return json_loads(data)
         raise ValueError(f"Unknown codec: {self.kind}")
 
 
@@ -142,7 +144,9 @@ class Database:
         self.cluster = None
         self._cluster_ready = asyncio.Event()
         self._manifest: JSON = {}
+        self._manifest_dirty = False
         self._indexes: Dict[str, Dict[str, Dict[Any, Set[str]]]] = {}
+        self._indexes_built = False
         self._cache = _LRU(max_entries=DEFAULT_CACHE_SIZE)
         self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
         self._codec = StorageCodec(codec)
@@ -228,7 +232,10 @@ class Database:
 
     async def __aenter__(self):
         _reset_context_vars()
-        await self._build_all_indexes()
+        # Local writes, sync_in and rollbacks keep indexes current, build once
+        if not self._indexes_built:
+            await self._build_all_indexes()
+            self._indexes_built = True
         return self
 
     async def _replicate_to_peers(self, sync_str: str) -> None:
@@ -259,7 +266,11 @@ class Database:
             locks = _locks_ctx.get()
             for doc_id, lock_id in locks.items():
                 await asyncio.shield(self.cluster.release(lock_id, [doc_id]))
-            self.main_path.write_text(json.dumps(self._manifest, indent=2))
+            # Read-only contexts leave the manifest untouched, skip rewriting it
+            if self._manifest_dirty:
+                self._manifest_dirty = False
+                manifest = json.dumps(self._manifest, indent=2)
+                await asyncio.to_thread(self.main_path.write_text, manifest)
 
     async def __aexit__(self, exc_type, exc, tb):
         sync_str = await self.sync_out()
@@ -290,6 +301,9 @@ class Database:
     def doc_version(self, table: str, id_: str) -> int:
         return int(self._tbl(table)["doc_versions"].get(id_, 0))
 
+    def doc_versions(self, table: str) -> dict[str, int]:
+        return dict(self._tbl(table)["doc_versions"])
+
     def ids(self, table: str) -> List[str]:
         tdir = self.base / table
         if not tdir.exists():
@@ -302,6 +316,12 @@ class Database:
             ]
         )
 
+    def exists(self, table: str, id_: str) -> bool:
+        """Check if a document exists without reading or decoding it."""
+        if (table, id_) in self._cache:
+            return True
+        return self._resolve_doc_path(table, id_).exists()
+
     async def get(self, table: str, id_: str) -> JSON | None:
         key = (table, id_)
         cached = self._cache.get(key)
@@ -374,6 +394,40 @@ class Database:
             incoming_version=None,
         )
 
+    @_requires_cluster
+    async def upsert_many(self, table: str, docs: dict[str, JSON]) -> None:
+        """Upsert several documents of a table.
+
+        Cluster locks for all ids are acquired with a single request instead
+        of one lock round trip per document.
+
+        Args:
+            table: Table name
+            docs: Mapping of document id to the full document to store
+        """
+        if not docs:
+            return
+        await self._acquire_locks(list(docs))
+        for id_, doc in docs.items():
+            await self.upsert(table, id_, doc)
+
+    @_requires_cluster
+    async def patch_many(self, table: str, changes: dict[str, JSON]) -> None:
+        """Patch several documents of a table.
+
+        Cluster locks for all ids are acquired with a single request instead
+        of one lock round trip per document.
+
+        Args:
+            table: Table name
+            changes: Mapping of document id to the changes to merge into it
+        """
+        if not changes:
+            return
+        await self._acquire_locks(list(changes))
+        for id_, doc in changes.items():
+            await self.patch(table, id_, doc)
+
     async def delete(
         self,
         table: str,
@@ -451,6 +505,7 @@ class Database:
                 t["doc_versions"][id_] = int(incoming_version)
             else:
                 t["doc_versions"][id_] = int(t["doc_versions"].get(id_, 0)) + 1
+            self._manifest_dirty = True
 
             changed = self._changed_dict().setdefault(table, set())
             changed.add(id_)
@@ -479,6 +534,7 @@ class Database:
             t = self._tbl(table)
             if id_ in t["doc_versions"]:
                 del t["doc_versions"][id_]
+                self._manifest_dirty = True
 
             deleted = self._deleted_dict().setdefault(table, set())
             deleted.add(id_)
@@ -540,10 +596,13 @@ class Database:
         for f, val in where.items():
             values = ensure_list(val)
             if f in idxs:
-                field_results = set()
-                for v in values:
-                    key = self._to_indexable_key(v)
-                    field_results |= idxs[f].get(key, set())
+                if candidate_ids is not None and not candidate_ids:
+                    # Intersection is already empty, no need to fold further
+                    continue
+                idx = idxs[f]
+                field_results = set().union(
+                    *(idx.get(self._to_indexable_key(v), ()) for v in values)
+                )
                 if candidate_ids is None:
                     candidate_ids = field_results
                 else:
@@ -560,24 +619,42 @@ class Database:
         if candidate_ids is None:
             candidate_ids = set(self.ids(table))
 
-        results: Set[str] = set()
+        compiled_where = compile_clause(where)
+        # Keep matched documents instead of loading them a second time
+        results: dict[str, JSON] = {}
         for id_ in candidate_ids:
             doc = await self.get(table, id_)
             if not doc:
                 continue
-            if match_clause(doc, where):
-                results.add(id_)
+            if match_compiled_clause(doc, compiled_where):
+                results[id_] = doc
 
         ordered = sorted(results)
         if limit is not None:
             ordered = ordered[:limit]
 
-        out: List[JSON] = []
-        for id_ in ordered:
+        return [results[id_] for id_ in ordered]
+
+    async def get_rows(self, table: str, ids: list[str]) -> list[JSON]:
+        """Load the list row projections of the given documents.
+
+        Unknown ids are skipped.
+
+        Args:
+            table: Table name
+            ids: Document ids to load
+        """
+        rows = []
+        projection_fields = LIST_ROW_FIELDS.get(table, _DEFAULT_LIST_ROW_FIELDS)
+
+        for id_ in ids:
             doc = await self.get(table, id_)
-            if doc:
-                out.append(doc)
-        return out
+            if not doc:
+                continue
+
+            rows.append({k: v for k, v in doc.items() if k in projection_fields})
+
+        return rows
 
     async def list_rows(
         self,
@@ -647,22 +724,23 @@ class Database:
         if not ids_to_load:
             return paginate_rows([], page, page_size, sort_attr, sort_reverse)
 
-        rows = []
-        projection_fields = LIST_ROW_FIELDS.get(table, _DEFAULT_LIST_ROW_FIELDS)
-
-        for id_ in ids_to_load:
-            doc = await self.get(table, id_)
-            if not doc:
-                continue
-
-            rows.append({k: v for k, v in doc.items() if k in projection_fields})
-
-        rows = filter_rows(rows, where, any_of, q)
+        rows = filter_rows(await self.get_rows(table, ids_to_load), where, any_of, q)
 
         if sort_attr != -1:
-            rows.sort(
-                key=create_sort_key(sort_attr, sort_reverse), reverse=sort_reverse
-            )
+            sort_key = create_sort_key(sort_attr, sort_reverse)
+            head_size = page * page_size if page_size >= 1 and page >= 1 else 0
+            if 0 < head_size < len(rows):
+                # Only the rows up to the requested page need to be ordered
+                pick = heapq.nlargest if sort_reverse else heapq.nsmallest
+                return paginate_rows(
+                    pick(head_size, rows, key=sort_key),
+                    page,
+                    page_size,
+                    sort_attr,
+                    sort_reverse,
+                    total=len(rows),
+                )
+            rows.sort(key=sort_key, reverse=sort_reverse)
 
         return paginate_rows(rows, page, page_size, sort_attr, sort_reverse)
 
@@ -674,7 +752,7 @@ class Database:
         return has_changes or has_deletes
 
     def _encode_sync_payload(self, payload: Dict[str, Any]) -> str:
-        raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        raw = json_dumps(payload)
         b64 = base64.b64encode(zlib.compress(raw)).decode("ascii")
         return "DBSYNC BLOCK " + b64
 
@@ -731,7 +809,7 @@ class Database:
                 if len(raw) > MAX_RAW_PAYLOAD_SIZE:
                     raise ValueError("raw payload too large")
 
-            payload = json.loads(raw.decode("utf-8"))
+            payload = json_loads(raw)
         except Exception as e:
             raise ValueError(f"Invalid sync payload: {e!s}")
 
@@ -838,6 +916,24 @@ class Database:
 
         return self._encode_sync_payload(payload)
 
+    async def _acquire_locks(self, ids: list[str]) -> None:
+        locks = _locks_ctx.get()
+        missing = [id_ for id_ in ids if id_ not in locks]
+        if not missing:
+            return
+
+        try:
+            lock_id = await self.cluster.acquire_lock(missing)
+        except Exception as e:
+            logger.critical(e)
+            raise Exception(
+                f"Could not acquire cluster lock for id {', '.join(missing)}"
+            )
+
+        for id_ in missing:
+            locks[id_] = lock_id
+        _locks_ctx.set(locks)
+
     @_requires_cluster
     async def _do_ops(
         self,
@@ -851,14 +947,7 @@ class Database:
         if kind not in ["delete", "upsert", "patch"]:
             raise ValueError(f"Unknown op {kind}")
 
-        try:
-            locks = _locks_ctx.get()
-            if id_ not in locks:
-                locks[id_] = await self.cluster.acquire_lock([id_])
-                _locks_ctx.set(locks)
-        except Exception as e:
-            logger.critical(e)
-            raise Exception(f"Could not acquire cluster lock for id {id_}")
+        await self._acquire_locks([id_])
 
         snapshots = _snapshots_ctx.get()
         if table not in snapshots:
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Any, List
 
 from components.logs import logger
 from components.utils.misc import ensure_list
 
 
+@lru_cache(maxsize=1024)
+def split_path(path: str) -> tuple[str, ...]:
+    """Split a dot-separated path once and cache the parts."""
+    return tuple(path.split("."))
+
+
 def get_all(doc: Any, path: str) -> List[Any]:
     """Extract all values at a given path in a document.
 
@@ -19,7 +27,7 @@ def get_all(doc: Any, path: str) -> List[Any]:
     Returns:
         List of all values found at the path
     """
-    parts = path.split(".")
+    parts = split_path(path)
 
     def walk(cur, idx):
         if idx == len(parts):
@@ -50,6 +58,9 @@ def merge_dict(dst: Any, src: Any) -> Any:
     Recursively merges src into dst. For nested dictionaries, merges recursively.
     For other types, src overwrites dst.
 
+    Only dictionaries along the merged paths are copied, dst itself is left
+    unchanged and values untouched by src are shared with the result.
+
     Args:
         dst: Destination dictionary
         src: Source dictionary to merge
@@ -58,35 +69,25 @@ def merge_dict(dst: Any, src: Any) -> Any:
         Merged result
     """
     if isinstance(dst, dict) and isinstance(src, dict):
-        out = dict()
-        for k in set(dst.keys()) | set(src.keys()):
-            if k in src:
-                if k in dst:
-                    out[k] = merge_dict(dst[k], src[k])
-                else:
-                    out[k] = src[k]
-            else:
-                v = dst[k]
-                if isinstance(v, dict):
-                    out[k] = dict(v)
-                elif isinstance(v, list):
-                    out[k] = list(v)
-                else:
-                    out[k] = v
+        out = dict(dst)
+        for k, v in src.items():
+            out[k] = merge_dict(out[k], v) if k in out else v
         return out
     return src
 
 
-def match_clause(row: dict, clause: dict) -> bool:
-    """Check if a row/doc matches a filter clause.
+def compile_clause(clause: dict | None) -> tuple[tuple[str, list], ...]:
+    """Normalize a filter clause into (path, options) pairs.
 
-    For each field in the clause:
-    - Get all values at that path in the document (handles nested paths)
-    - Check if any clause value matches any document value (OR within field)
-    - All fields must match (AND across fields)
+    Filtering many rows against the same clause should compile it once and
+    use match_compiled_clause for every row.
     """
-    for k, v in (clause or {}).items():
-        options = ensure_list(v)
+    return tuple((k, ensure_list(v)) for k, v in (clause or {}).items())
+
+
+def match_compiled_clause(row: dict, compiled: tuple[tuple[str, list], ...]) -> bool:
+    """Check if a row/doc matches a clause prepared by compile_clause."""
+    for k, options in compiled:
         dvals = get_all(row, k)
         if not any(opt in dvals for opt in options):
             return False
@@ -100,71 +101,73 @@ def filter_rows(
     q: str | None,
 ) -> list[dict]:
     """Filter rows based on where, any_of, and q parameters."""
-    if where is None and any_of is None and not q:
+    if where and any_of:
+        for c in any_of:
+            for conflict in where.keys() & c.keys():
+                c.pop(conflict, None)
+                logger.warning(
+                    f"Overlapping key {conflict!r} in 'where' and 'any_of' clause. "
+                    + "Key will be removed from 'any_of' clause"
+                )
+
+    # An empty any_of clause matches every row, like an empty search term
+    if any_of and not all(any_of):
+        any_of = None
+
+    if not where and not any_of and not q:
         return rows_in
 
+    compiled_where = compile_clause(where)
+    compiled_any_of = [compile_clause(c) for c in any_of or []]
+    # One case-insensitive pattern instead of lowercasing a copy of every value
+    needle = re.compile(re.escape(q), re.IGNORECASE) if q else None
+
     out = []
     for r in rows_in:
         ok = True
-        if where:
-            ok = match_clause(r, where)
+        if compiled_where:
+            ok = match_compiled_clause(r, compiled_where)
         if ok and any_of:
-            for c in any_of:
-                if where:
-                    for conflict in where.keys() & c.keys():
-                        c.pop(conflict, None)
-                        logger.warning(
-                            f"Overlapping key {conflict!r} in 'where' and 'any_of' clause. "
-                            + "Key will be removed from 'any_of' clause"
-                        )
-                if match_clause(r, c):
+            for c in compiled_any_of:
+                if match_compiled_clause(r, c):
                     break
             else:
                 ok = False
-        if ok and q:
-            needle = q.lower()
-            ok = any(
-                (isinstance(v, str) and needle in v.lower())
-                or (not isinstance(v, (dict, list)) and needle in str(v).lower())
-                for v in r.values()
-            )
+        if ok and needle:
+            for v in r.values():
+                if isinstance(v, str):
+                    if needle.search(v) is not None:
+                        break
+                elif not isinstance(v, (dict, list)):
+                    if needle.search(str(v)) is not None:
+                        break
+            else:
+                ok = False
         if ok:
             out.append(r)
     return out
 
 
-def type_rank(v: Any) -> int:
-    """Return a sort rank for a value's type."""
-    if v is None:
-        return 5
-    if isinstance(v, bool):
-        return 2
-    if isinstance(v, (int, float)):
-        return 0
-    if isinstance(v, str):
-        return 1
-    return 3
-
-
-def normalize_sort_value(v: Any) -> Any:
-    """Normalize a value for sorting."""
-    if v is None:
-        return ""
-    if isinstance(v, str):
-        return v.lower()
-    return v
-
-
 def create_sort_key(sort_attr: str | int, sort_reverse: bool):
-    """Create a sort key function for sorting rows."""
+    """Create a sort key function for sorting rows.
+
+    Rows sort by (missing, type rank, value): numbers, then strings compared
+    case-insensitively, then booleans, then other types. Missing values end
+    up last in either sort direction.
+    """
+    present_key, missing_key = (1, 0) if sort_reverse else (0, 1)
 
     def key_func(row: dict):
         v = row.get(sort_attr, None)
-        missing = v is None
-        missing_key = 1 if missing else 0
-        if sort_reverse:
-            missing_key = 1 - missing_key
-        return (missing_key, type_rank(v), normalize_sort_value(v))
+        if v is None:
+            return (missing_key, 5, "")
+        if isinstance(v, bool):
+            return (present_key, 2, v)
+        if isinstance(v, (int, float)):
+            return (present_key, 0, v)
+        if isinstance(v, str):
+            return (present_key, 1, v.lower())
+        return (present_key, 3, v)
 
     return key_func
 
@@ -175,9 +178,15 @@ def paginate_rows(
     page_size: int,
     sort_attr: str | int,
     sort_reverse: bool,
+    total: int | None = None,
 ) -> dict:
-    """Apply pagination to rows and return pagination metadata."""
-    total = len(rows)
+    """Apply pagination to rows and return pagination metadata.
+
+    If only the leading rows up to the requested page were passed, total
+    must be set to the number of all rows.
+    """
+    if total is None:
+        total = len(rows)
     if page_size == -1:
         items = rows
         total_pages = 1
@@ -81,7 +81,6 @@ class LockedSet(set):
 class GlobalState:
     _lock: RLock = field(default_factory=RLock, repr=False)
     _challenge_options: LockedDict = field(default_factory=LockedDict)
-    locations: LockedDict = field(default_factory=LockedDict)
     promote_users: LockedSet[str] = field(default_factory=LockedSet)
     queued_user_tasks: LockedDict[str, object] = field(default_factory=LockedDict)
     query_cache: LockedDict[str, object] = field(default_factory=LockedDict)
@@ -1,7 +1,7 @@
 import os
 import asyncio
 
-from components.models.helpers import validate_uuid_str, to_str
+from components.models.helpers import validate_uuid_str, strip_str
 from dataclasses import dataclass
 from magic import Magic
 from uuid import uuid4
@@ -10,6 +10,11 @@ from werkzeug.utils import secure_filename
 mime = Magic(mime=True)
 
 
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 @dataclass
 class Asset:
     id: str
@@ -20,12 +25,12 @@ class Asset:
         self.id = validate_uuid_str(self.id)
 
         if self.filename:
-            self.filename = secure_filename(to_str(self.filename.strip())) or self.id
+            self.filename = secure_filename(strip_str(self.filename)) or self.id
         else:
             self.filename = self.id
 
         if self.overlay:
-            self.overlay = to_str(self.overlay.strip()) or None
+            self.overlay = strip_str(self.overlay) or None
 
     @property
     def mime_type(self) -> str:
@@ -50,8 +55,7 @@ class Asset:
         asset_id = validate_uuid_str(kwargs.get("id", str(uuid4())))
         asset_path = f"assets/{asset_id}"
 
-        with open(asset_path, "wb") as f:
-            f.write(data_bytes)
+        await asyncio.to_thread(_write_bytes, asset_path, data_bytes)
 
         filename = kwargs.pop("filename", asset_id)
         overlay = kwargs.pop("overlay", None)
@@ -64,33 +68,33 @@ class Asset:
             loseless = kwargs.pop("loseless", True)
             quality = kwargs.pop("quality", 90)
             try:
-                if (
-                    asset.mime_type.startswith("image/")
-                    and asset.mime_type != "image/webp"
-                ):
+                mime_type = asset.mime_type
+                if mime_type.startswith("image/") and mime_type != "image/webp":
                     compressed_bytes = await asyncio.to_thread(
                         convert_image_to_webp,
                         image=data_bytes,
                         quality=quality,
                         loseless=loseless,
                     )
-                    with open(asset_path, "wb") as f:
-                        f.write(compressed_bytes)
+                    await asyncio.to_thread(_write_bytes, asset_path, compressed_bytes)
             except Exception as e:
                 logger.warning(
                     f"Failed to compress image {asset.filename} ({asset.id}): {e}"
                 )
 
         if cluster:
-            ok_peers = set()
-            for peer in cluster.peers.get_established():
-                try:
-                    await cluster.files.fileput(asset_path, asset_path, peer)
-                    ok_peers.add(peer)
-                except:
-                    os.unlink(asset_path)
-                    for peer in ok_peers:
+            # Push to all peers at once, a slow peer no longer delays the others
+            peers = list(cluster.peers.get_established())
+            results = await asyncio.gather(
+                *(cluster.files.fileput(asset_path, asset_path, p) for p in peers),
+                return_exceptions=True,
+            )
+            errors = [r for r in results if isinstance(r, BaseException)]
+            if errors:
+                os.unlink(asset_path)
+                for peer, result in zip(peers, results):
+                    if not isinstance(result, BaseException):
                         await cluster.files.filedel(asset_path, peer)
-                    raise
+                raise errors[0]
 
-            return asset
+        return asset
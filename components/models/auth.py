@@ -1,6 +1,6 @@
-import random
+import secrets
 
-from components.models.helpers import to_str, to_int, validate_uuid_str
+from components.models.helpers import strip_str, to_int, validate_uuid_str
 from dataclasses import dataclass
 from functools import cached_property
 
@@ -12,7 +12,7 @@ class TokenConfirmation:
 
     def __post_init__(self) -> None:
         self.confirmation_code = "%06d" % to_int(self.confirmation_code)
-        self.token = to_str(self.token.strip())
+        self.token = strip_str(self.token)
         if len(self.token) != 14:
             raise ValueError("token", "'token' has wrong length")
 
@@ -24,14 +24,12 @@ class Authentication:
 
     @cached_property
     def token(self) -> str:
-        return "%04d-%04d-%04d" % (
-            random.randint(0, 9999),
-            random.randint(0, 9999),
-            random.randint(0, 9999),
-        )
+        head, low = divmod(secrets.randbelow(10**12), 10**4)
+        high, mid = divmod(head, 10**4)
+        return "%04d-%04d-%04d" % (high, mid, low)
 
     def __post_init__(self) -> None:
-        self.login = to_str(self.login.strip())
+        self.login = strip_str(self.login)
         if len(self.login) < 3:
             raise ValueError("login", "'login' must be at least 3 characters long")
 
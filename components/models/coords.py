@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from components.models.helpers import to_int, to_str
+from components.models.helpers import to_int, strip_str
 
 
 @dataclass
@@ -39,7 +39,7 @@ class Location:
         self.zoom = to_int(self.zoom)
 
         if self.display_name is not None:
-            self.display_name = to_str(self.display_name.strip()) or None
+            self.display_name = strip_str(self.display_name) or None
 
         self.lat = float(self.lat)
         self.lon = float(self.lon)
@@ -1,5 +1,11 @@
-from components.models.helpers import to_str, to_int, to_bool
-from dataclasses import asdict, dataclass, field, fields, replace
+from components.models.helpers import (
+    PatchTemplate,
+    shallow_fields,
+    strip_str,
+    to_int,
+    to_bool,
+)
+from dataclasses import dataclass, field
 from components.utils.datetimes import utc_now_as_str
 
 
@@ -9,7 +15,7 @@ class CredentialBase:
     created: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CredentialData:
     id: str | bytes
     public_key: str
@@ -19,8 +25,17 @@ class CredentialData:
     last_login: str | None = None
 
 
-@dataclass
+@dataclass(eq=False)
 class Credential(CredentialData, CredentialBase):
+    # Credentials are identified by their id alone, no need to compare keys
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Credential):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
     def __post_init__(self):
         if not isinstance(self.id, (str, bytes)) or self.id == "":
             raise ValueError("id", "'id' must be a non-empty string or bytes")
@@ -28,31 +43,28 @@ class Credential(CredentialData, CredentialBase):
         if isinstance(self.id, bytes):
             self.id = self.id.hex()
 
-        if (
-            not isinstance(self.public_key, str)
-            or to_str(self.public_key.strip()) == ""
-        ):
+        if not isinstance(self.public_key, str) or strip_str(self.public_key) == "":
             raise ValueError("public_key", "'public_key' must be a non-empty string")
 
-        if not isinstance(self.updated, str) or to_str(self.updated.strip()) == "":
+        if not isinstance(self.updated, str) or strip_str(self.updated) == "":
             raise ValueError("updated", "'updated' must be a non-empty string")
 
-        if not isinstance(self.created, str) or to_str(self.created.strip()) == "":
+        if not isinstance(self.created, str) or strip_str(self.created) == "":
             raise ValueError("created", "'created' must be a non-empty string")
 
         if self.last_login is not None:
-            self.last_login = to_str(self.last_login.strip()) or None
+            self.last_login = strip_str(self.last_login) or None
 
         self.sign_count = to_int(self.sign_count)
         self.active = to_bool(self.active)
 
-        self.friendly_name = to_str(self.friendly_name.strip())
+        self.friendly_name = strip_str(self.friendly_name)
         if not self.friendly_name:
             self.friendly_name = "New passkey"
 
 
 @dataclass
-class CredentialPatch(CredentialData):
+class CredentialPatch(CredentialData, PatchTemplate):
     updated: str = field(default_factory=utc_now_as_str, init=False)
     id: str = field(default=None, init=False, repr=False)
     active: bool | None = None
@@ -60,23 +72,14 @@ class CredentialPatch(CredentialData):
     public_key: str | None = None
     friendly_name: str | None = None
 
-    def dump_patched(self):
-        return {
-            f.name: getattr(self, f.name)
-            for f in fields(self)
-            if getattr(self, f.name) is not None
-        }
 
-    def merge(self, original: Credential):
-        return replace(original, **self.dump_patched())
-
-
-@dataclass
+@dataclass(slots=True)
 class CredentialAdd(CredentialData):
-    updated: str = field(default_factory=utc_now_as_str, init=False)
+    updated: str = field(default=None, init=False)
     created: str = field(default_factory=utc_now_as_str, init=False)
 
     def __post_init__(self):
-        Credential(**asdict(self))
+        self.updated = self.created
         if isinstance(self.id, bytes):
             self.id = self.id.hex()
+        Credential(**shallow_fields(self))
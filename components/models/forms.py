@@ -1,3 +1,10 @@
+import sys
+from types import MappingProxyType
+
+_INPUT_EXTRA = sys.intern(
+    'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"'
+)
+
 model_forms = {
     "objects": {
         "processings": {
@@ -5,13 +12,13 @@ model_forms = {
                 "title": "VIN (Vehicle Identification Number)",
                 "description": "The vehicle's identification number",
                 "type": "text",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "assigned_project": {
                 "title": "Assigned Project",
                 "description": "Assign this car to a project",
                 "type": "project",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "assets": {
                 "title": "Assets",
@@ -24,13 +31,13 @@ model_forms = {
                 "title": "Name",
                 "description": "The name of the project",
                 "type": "text",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "assigned_users": {
                 "title": "Administrative Users",
                 "description": "These users are allowed to fully administer the project",
                 "type": "users:multi",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "location": {"title": "Location", "type": "location"},
             "notes": {
@@ -38,7 +45,7 @@ model_forms = {
                 "vault": "true",
                 "description": "Additional information; free text",
                 "type": "textarea",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
         },
         "cars": {
@@ -46,37 +53,37 @@ model_forms = {
                 "title": "VIN (Vehicle Identification Number)",
                 "description": "The vehicle's identification number",
                 "type": "text",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "assigned_users": {
                 "title": "Administrative Users",
                 "description": "These users are allowed to fully administer the car",
                 "type": "users:multi",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "vendor": {
                 "title": "Manufacturer",
                 "description": "The vehicle's manufacturer",
                 "type": "text",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "model": {
                 "title": "Model",
                 "description": "The manufacturer's model designation",
                 "type": "text",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "year": {
                 "title": "Year of Manufacture",
                 "description": "The vehicle's year of manufacture",
                 "type": "number",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "assigned_project": {
                 "title": "Assigned Project",
                 "description": "Assign this car to a project",
                 "type": "project",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "car_markers": {
                 "title": "Car markers",
@@ -89,7 +96,7 @@ model_forms = {
                 "vault": "true",
                 "description": "Additional information; free text",
                 "type": "textarea",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "assets": {
                 "title": "Assets",
@@ -103,29 +110,29 @@ model_forms = {
             "vault": {
                 "title": "Vault configuration",
                 "type": "vault",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "first_name": {
                 "title": "First name",
                 "type": "text",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "last_name": {
                 "title": "Last name",
                 "type": "text",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "email": {
                 "title": "Email address",
                 "description": "Optional email address",
                 "type": "email",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "access_tokens": {
                 "title": "API keys",
                 "description": "API keys can be used for programmatic access",
                 "type": "list:text",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "permit_auth_requests": {
                 "title": "Interactive sign-in requests",
@@ -141,20 +148,22 @@ model_forms = {
                 "title": "Claude API key",
                 "description": "Claude API key",
                 "type": "text",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "claude_model": {
                 "title": "Claude API model",
                 "description": "Claude API model",
                 "type": "text",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
             "google_vision_api_key": {
                 "title": "Google Vision API key",
                 "description": "Google Vision API key",
                 "type": "text",
-                "input_extra": 'autocomplete="off" autocorrect="off" autocapitalize="off" spellcheck="false"',
+                "input_extra": _INPUT_EXTRA,
             },
         }
     },
 }
+
+model_forms = MappingProxyType(model_forms)
@@ -1,8 +1,10 @@
 import json
 import re
-from components.utils.misc import ensure_list
+from components.utils.misc import ensure_list, ensure_unique_list, json_loads
+from dataclasses import MISSING, dataclass, fields, is_dataclass, replace
+from functools import cache, lru_cache
 from uuid import UUID
-from typing import Any
+from typing import Any, Protocol
 
 ATOM_CHAR = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]"
 DOT_ATOM = rf"(?:{ATOM_CHAR}+)(?:\.{ATOM_CHAR}+)*"
@@ -15,25 +17,108 @@ IPv6_LITERAL = r"\[IPv6:[0-9A-Fa-f:.]+\]"
 DOMAIN_PART = rf"(?:{FQDN}|{IPv4_LITERAL}|{IPv6_LITERAL})"
 EMAIL_REGEX = re.compile(rf"^{LOCAL_PART}@{DOMAIN_PART}$")
 HEX_COLOR_PATTERN_STANDARD = re.compile(r"^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$")
+CANONICAL_UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
 
 
 def hex_color_validator(color_string: str) -> bool:
     return bool(HEX_COLOR_PATTERN_STANDARD.match(color_string))
 
 
+@lru_cache(maxsize=8192)
 def email_validator(email: str) -> bool:
     return EMAIL_REGEX.fullmatch(email) is not None
 
 
-def validate_uuid_str(value: str) -> str:
-    if not isinstance(value, str):
-        raise TypeError(f"Value must be string, got {type(value).__name__}")
+@lru_cache(maxsize=8192)
+def _canonical_uuid_str(value: str) -> str:
     try:
         return str(UUID(value))
     except Exception:
         raise ValueError(f"Invalid UUID like string: {value!r}")
 
 
+def validate_uuid_str(value: str) -> str:
+    if not isinstance(value, str):
+        raise TypeError(f"Value must be string, got {type(value).__name__}")
+    # Ids written by uuid4() are already canonical, skip the UUID round-trip
+    if CANONICAL_UUID_PATTERN.fullmatch(value):
+        return value
+    return _canonical_uuid_str(value)
+
+
+def validate_uuid_list(value: list[str] | str | None) -> list[str]:
+    return [validate_uuid_str(u) for u in ensure_unique_list(value)]
+
+
+@cache
+def field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def shallow_fields(obj: object) -> dict:
+    return {name: getattr(obj, name) for name in field_names(type(obj))}
+
+
+def _plain_value(value: Any) -> Any:
+    value_type = type(value)
+    if value_type is list:
+        return [_plain_value(v) for v in value]
+    elif value_type is dict:
+        return {k: _plain_value(v) for k, v in value.items()}
+    elif value_type is tuple:
+        return tuple(_plain_value(v) for v in value)
+    elif is_dataclass(value_type):
+        return shallow_asdict(value)
+    return value
+
+
+def shallow_asdict(obj: object) -> dict:
+    # Like dataclasses.asdict, but scalars are passed through instead of deep-copied
+    return {name: _plain_value(getattr(obj, name)) for name in field_names(type(obj))}
+
+
+@cache
+def _field_defaults(cls: type) -> tuple[tuple[str, Any, Any], ...]:
+    return tuple((f.name, f.default, f.default_factory) for f in fields(cls))
+
+
+def construct_trusted(cls: type, data: dict) -> object:
+    instance = object.__new__(cls)
+    for name, default, default_factory in _field_defaults(cls):
+        if name in data:
+            value = data[name]
+        elif default is not MISSING:
+            value = default
+        elif default_factory is not MISSING:
+            value = default_factory()
+        else:
+            raise TypeError(f"Missing field {name!r} for {cls.__name__}")
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+@dataclass
+class PatchTemplate:
+    def merge(self, original: Protocol):
+        return replace(original, **self.dump_patched())
+
+    def dump_patched(self):
+        return {
+            name: value
+            for name in field_names(type(self))
+            if (value := getattr(self, name)) is not None
+        }
+
+    def dump_merged(self, merged: object) -> dict:
+        # Validated values of the patched fields only, written as a partial update
+        # so fields blanked on the request-local object never reach storage
+        return {
+            name: _plain_value(getattr(merged, name)) for name in self.dump_patched()
+        }
+
+
 def to_location(val: dict | object) -> "Location":  # noqa: F821
     from .coords import Location
     from components.utils.osm import CoordsResolver
@@ -78,6 +163,12 @@ def to_str(val: int | str | None) -> str:
         raise ValueError(f"Cannot convert '{val!r}' to str")
 
 
+def strip_str(val: str | None) -> str:
+    if type(val) is str:
+        return val.strip()
+    return to_str(val).strip()
+
+
 def to_bool(val: bool | str) -> bool:
     if isinstance(val, bool):
         return val
@@ -94,13 +185,14 @@ def to_assets(data: Any) -> list["Asset"]:  # noqa: F821
 
     assets = []
     for item in ensure_list(data):
-        if isinstance(item, Asset):
+        item_type = type(item)
+        if item_type is Asset:
             assets.append(item)
-        elif isinstance(item, dict):
+        elif item_type is dict:
             assets.append(Asset(**item))
-        elif isinstance(item, str):
+        elif item_type is str:
             try:
-                item = json.loads(item)
+                item = json_loads(item)
                 assets.extend(to_assets(item))
             except json.JSONDecodeError:
                 raise ValueError("assets", f"Invalid asset JSON: {item}")
@@ -118,13 +210,14 @@ def to_car_markers(data: Any) -> list["CarMarker"]:  # noqa: F821
 
     car_markers = []
     for item in ensure_list(data):
-        if isinstance(item, CarMarker):
+        item_type = type(item)
+        if item_type is CarMarker:
             car_markers.append(item)
-        elif isinstance(item, dict):
+        elif item_type is dict:
             car_markers.append(CarMarker(**item))
-        elif isinstance(item, str):
+        elif item_type is str:
             try:
-                item = json.loads(item)
+                item = json_loads(item)
                 car_markers.extend(to_car_markers(item))
             except json.JSONDecodeError:
                 raise ValueError("car_markers", f"Invalid car_markers JSON: {item}")
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from components.models.helpers import to_int, to_float, to_str, hex_color_validator
+from components.models.helpers import to_int, to_float, strip_str, hex_color_validator
 
 
 @dataclass
@@ -18,7 +18,7 @@ class CarMarker:
             )
 
         if self.name is not None:
-            self.name = to_str(self.name.strip()) or None
+            self.name = strip_str(self.name) or None
 
         self.x = to_float(self.x)
         self.y = to_float(self.y)
@@ -2,18 +2,23 @@ from components.models.assets import Asset
 from components.models.coords import Location
 from components.models.markers import CarMarker
 from components.models.helpers import (
+    PatchTemplate,
+    construct_trusted,
     to_assets,
     to_car_markers,
     to_bool,
     to_int,
     to_location,
-    to_str,
+    strip_str,
+    validate_uuid_list,
     validate_uuid_str,
 )
 from components.utils.datetimes import utc_now_as_str
-from components.utils.misc import ensure_list, unique_list
-from dataclasses import asdict, dataclass, field, fields, replace
-from typing import Protocol
+from components.utils.vins.processor import VINProcessor
+from copy import copy
+from dataclasses import dataclass, field
+from functools import partial
+from types import MappingProxyType
 from uuid import uuid4
 
 
@@ -24,6 +29,24 @@ class BaseObjectTemplate:
     created: str
     doc_version: int | str
 
+    @classmethod
+    def from_document(cls, doc: dict) -> "BaseObjectTemplate":
+        # Stored documents were validated on write, skip __post_init__
+        obj = construct_trusted(cls, doc)
+        if isinstance(obj.location, dict):
+            obj.location = construct_trusted(Location, obj.location)
+        if getattr(obj, "assets", None):
+            obj.assets = [
+                a if isinstance(a, Asset) else construct_trusted(Asset, a)
+                for a in obj.assets
+            ]
+        if getattr(obj, "car_markers", None):
+            obj.car_markers = [
+                m if isinstance(m, CarMarker) else construct_trusted(CarMarker, m)
+                for m in obj.car_markers
+            ]
+        return obj
+
 
 @dataclass
 class ObjectPagination:
@@ -35,8 +58,10 @@ class ObjectPagination:
     elements: int | str = 0
 
     def __post_init__(self) -> None:
-        for name in ("page", "page_size", "pages", "elements"):
-            setattr(self, name, to_int(getattr(self, name)))
+        self.page = to_int(self.page)
+        self.page_size = to_int(self.page_size)
+        self.pages = to_int(self.pages)
+        self.elements = to_int(self.elements)
 
         self.sort_reverse = to_bool(self.sort_reverse)
 
@@ -71,39 +96,146 @@ class ObjectCarData:
     assets: list[Asset | dict | str | None] | Asset | dict | str | None = None
 
 
+def _validate_non_empty_str(name: str, value: str) -> str:
+    if not isinstance(value, str) or strip_str(value) == "":
+        raise ValueError(name, f"'{name}' must be a non-empty string")
+    return value
+
+
+def _validate_optional_str(name: str, value: str | None) -> str | None:
+    if value is not None and not isinstance(value, str):
+        raise TypeError(
+            name,
+            f"'{name}' must be string or None, got {type(value).__name__}",
+        )
+    return value
+
+
+def _validate_name(name: str) -> str:
+    if not isinstance(name, str) or strip_str(name) == "":
+        raise ValueError("'name' must be a non-empty string")
+    return name
+
+
+def _validate_assigned_users(assigned_users: list[str] | str) -> list[str]:
+    assigned_users = validate_uuid_list(assigned_users)
+    if not assigned_users:
+        raise ValueError("assigned_users", "'assigned_users' must not be empty")
+    return assigned_users
+
+
+def _validate_assigned_project(assigned_project: str | None) -> str | None:
+    if assigned_project == "" or assigned_project is None:
+        return None
+    return validate_uuid_str(assigned_project)
+
+
+def _validate_location(location: Location | dict | None) -> Location | None:
+    if location is None:
+        return None
+    location_type = type(location)
+    if location_type is dict or location_type is Location:
+        return to_location(location)
+    raise TypeError(
+        "location",
+        f"'location' must be Location, dict or None, got {type(location).__name__}",
+    )
+
+
+def _validate_vin(vin: str) -> str:
+    if not isinstance(vin, str) or strip_str(vin) == "":
+        raise TypeError(
+            "vin",
+            f"'vin' must be non-empty string, got {type(vin).__name__}",
+        )
+    vin = strip_str(vin)
+    if not VINProcessor.validate(vin):
+        raise ValueError("vin", "'vin' is not a valid VIN")
+    return vin
+
+
+def _validate_car_markers(car_markers):
+    return to_car_markers(car_markers) if car_markers else car_markers
+
+
+def _validate_assets(assets):
+    return to_assets(assets) if assets else assets
+
+
+PROJECT_FIELD_VALIDATORS = {
+    "name": _validate_name,
+    "assigned_users": _validate_assigned_users,
+    "location": _validate_location,
+    "notes": partial(_validate_optional_str, "notes"),
+}
+
+CAR_FIELD_VALIDATORS = {
+    "year": to_int,
+    "assigned_project": _validate_assigned_project,
+    "assigned_users": _validate_assigned_users,
+    "vin": _validate_vin,
+    "vendor": partial(_validate_optional_str, "vendor"),
+    "model": partial(_validate_optional_str, "model"),
+    "location": _validate_location,
+    "notes": partial(_validate_optional_str, "notes"),
+    "car_markers": _validate_car_markers,
+    "assets": _validate_assets,
+}
+
+
+def _validate_project(project: ObjectProjectData) -> None:
+    project.id = validate_uuid_str(project.id)
+    project.doc_version = to_int(project.doc_version)
+    _validate_non_empty_str("created", project.created)
+    _validate_non_empty_str("updated", project.updated)
+
+    for name, validator in PROJECT_FIELD_VALIDATORS.items():
+        setattr(project, name, validator(getattr(project, name)))
+
+
+def _validate_car(car: ObjectCarData) -> None:
+    car.id = validate_uuid_str(car.id)
+    car.doc_version = to_int(car.doc_version)
+    _validate_non_empty_str("created", car.created)
+    _validate_non_empty_str("updated", car.updated)
+
+    for name, validator in CAR_FIELD_VALIDATORS.items():
+        setattr(car, name, validator(getattr(car, name)))
+
+
+def _merge_patched(
+    patch: PatchTemplate, original: BaseObjectTemplate, validators: dict
+) -> BaseObjectTemplate:
+    # Only re-validate the patched fields, the original is left untouched
+    patched = copy(original)
+    for name, value in patch.dump_patched().items():
+        validator = validators.get(name)
+        setattr(patched, name, validator(value) if validator else value)
+    return patched
+
+
 @dataclass
 class ObjectAddCar(ObjectCarData):
     id: str = field(default_factory=lambda: str(uuid4()), init=False)
-    updated: str = field(default_factory=utc_now_as_str, init=False)
+    updated: str = field(default=None, init=False)
     created: str = field(default_factory=utc_now_as_str, init=False)
     doc_version: int = field(default=0, init=False)
 
     def __post_init__(self):
-        ObjectCar(**asdict(self))
+        self.updated = self.created
+        _validate_car(self)
 
 
 @dataclass
 class ObjectAddProject(ObjectProjectData):
     id: str = field(default_factory=lambda: str(uuid4()), init=False)
-    updated: str = field(default_factory=utc_now_as_str, init=False)
+    updated: str = field(default=None, init=False)
     created: str = field(default_factory=utc_now_as_str, init=False)
     doc_version: int = field(default=0, init=False)
 
     def __post_init__(self):
-        ObjectProject(**asdict(self))
-
-
-@dataclass
-class PatchTemplate:
-    def merge(self, original: Protocol):
-        return replace(original, **self.dump_patched())
-
-    def dump_patched(self):
-        return {
-            f.name: getattr(self, f.name)
-            for f in fields(self)
-            if getattr(self, f.name) is not None
-        }
+        self.updated = self.created
+        _validate_project(self)
 
 
 @dataclass
@@ -113,6 +245,9 @@ class ObjectPatchCar(ObjectCarData, PatchTemplate):
     assigned_users: list[str] | str | None = None
     updated: str = field(default_factory=utc_now_as_str, init=False)
 
+    def merge(self, original: "ObjectCar") -> "ObjectCar":
+        return _merge_patched(self, original, CAR_FIELD_VALIDATORS)
+
 
 @dataclass
 class ObjectPatchProject(ObjectProjectData, PatchTemplate):
@@ -121,42 +256,14 @@ class ObjectPatchProject(ObjectProjectData, PatchTemplate):
     assigned_users: str | list[str] | None = None
     updated: str = field(default_factory=utc_now_as_str, init=False)
 
+    def merge(self, original: "ObjectProject") -> "ObjectProject":
+        return _merge_patched(self, original, PROJECT_FIELD_VALIDATORS)
+
 
 @dataclass
 class ObjectProject(ObjectProjectData, BaseObjectTemplate):
     def __post_init__(self) -> None:
-        self.id = validate_uuid_str(self.id)
-        self.doc_version = to_int(self.doc_version)
-
-        if not isinstance(self.created, str) or to_str(self.created.strip()) == "":
-            raise ValueError("created", "'created' must be a non-empty string")
-
-        if not isinstance(self.updated, str) or to_str(self.updated.strip()) == "":
-            raise ValueError("updated", "'updated' must be a non-empty string")
-
-        if not isinstance(self.name, str) or to_str(self.name.strip()) == "":
-            raise ValueError("'name' must be a non-empty string")
-
-        self.assigned_users = [
-            validate_uuid_str(u) for u in unique_list(ensure_list(self.assigned_users))
-        ]
-        if not self.assigned_users:
-            raise ValueError("assigned_users", "'assigned_users' must not be empty")
-
-        if self.location is not None:
-            if isinstance(self.location, (dict, Location)):
-                self.location = to_location(self.location)
-            else:
-                raise TypeError(
-                    "location",
-                    f"'location' must be Location, dict or None, got {type(self.location).__name__}",
-                )
-
-        if self.notes is not None and not isinstance(self.notes, str):
-            raise TypeError(
-                "notes",
-                f"'notes' must be string or None, got {type(self.notes).__name__}",
-            )
+        _validate_project(self)
 
 
 @dataclass
@@ -166,75 +273,12 @@ class ObjectCar(ObjectCarData, BaseObjectTemplate):
         return self.vin
 
     def __post_init__(self) -> None:
-        from components.utils.vins.processor import VINProcessor
-
-        self.id = validate_uuid_str(self.id)
-        self.doc_version = to_int(self.doc_version)
-        self.year = to_int(self.year)
-
-        if not isinstance(self.created, str) or to_str(self.created.strip()) == "":
-            raise ValueError("created", "'created' must be a non-empty string")
-
-        if not isinstance(self.updated, str) or to_str(self.updated.strip()) == "":
-            raise ValueError("updated", "'updated' must be a non-empty string")
-
-        if self.assigned_project == "":
-            self.assigned_project = None
-        elif self.assigned_project is not None:
-            self.assigned_project = validate_uuid_str(self.assigned_project)
-
-        self.assigned_users = [
-            validate_uuid_str(u) for u in unique_list(ensure_list(self.assigned_users))
-        ]
-        if not self.assigned_users:
-            raise ValueError("assigned_users", "'assigned_users' must not be empty")
-
-        if not isinstance(self.vin, str) or to_str(self.vin.strip()) == "":
-            raise TypeError(
-                "vin",
-                f"'vin' must be non-empty string, got {type(self.vin).__name__}",
-            )
-        self.vin = to_str(self.vin.strip())
-        if not VINProcessor.validate(self.vin):
-            raise ValueError("vin", "'vin' is not a valid VIN")
-
-        if self.vendor is not None and not isinstance(self.vendor, str):
-            raise TypeError(
-                "vendor",
-                f"'vendor' must be string or None, got {type(self.vendor).__name__}",
-            )
-
-        if self.model is not None and not isinstance(self.model, str):
-            raise TypeError(
-                "model",
-                f"'model' must be string or None, got {type(self.model).__name__}",
-            )
-
-        if self.location is not None:
-            if isinstance(self.location, (dict, Location)):
-                self.location = to_location(self.location)
-            else:
-                raise TypeError(
-                    "location",
-                    f"'location' must be Location, dict or None, got {type(self.location).__name__}",
-                )
-
-        if self.notes is not None and not isinstance(self.notes, str):
-            raise TypeError(
-                "notes",
-                f"'notes' must be string or None, got {type(self.notes).__name__}",
-            )
-
-        if self.car_markers:
-            self.car_markers = to_car_markers(self.car_markers)
-
-        if self.assets:
-            self.assets = to_assets(self.assets)
+        _validate_car(self)
 
 
 model_meta = {
     "objects": {
-        "types": ["cars", "projects"],
+        "types": ("cars", "projects"),
         "patch": {
             "cars": ObjectPatchCar,
             "projects": ObjectPatchProject,
@@ -248,15 +292,17 @@ model_meta = {
             "projects": ObjectProject,
         },
         "unique_fields": {  # str only
-            "cars": ["vin", "assigned_project"],
-            "projects": ["name"],
+            "cars": ("vin", "assigned_project"),
+            "projects": ("name",),
         },
         "display_attr": {  # default is 'name'
             "cars": "vin",
         },
         "system_fields": {
-            "cars": ["assigned_users"],
-            "projects": ["assigned_users"],
+            "cars": ("assigned_users",),
+            "projects": ("assigned_users",),
         },
     }
 }
+
+model_meta = MappingProxyType(model_meta)
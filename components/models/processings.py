@@ -1,14 +1,16 @@
 from components.models.assets import Asset
 from components.models.coords import Location
 from components.models.helpers import (
-    to_str,
+    construct_trusted,
+    strip_str,
     validate_uuid_str,
     to_int,
     to_location,
     to_assets,
 )
 from components.utils.datetimes import utc_now_as_str
-from dataclasses import dataclass, field, asdict
+from components.utils.vins.processor import VINProcessor
+from dataclasses import dataclass, field
 from uuid import uuid4
 from typing import Any
 
@@ -29,42 +31,57 @@ class ProcessingData:
     vin: str | None = None
 
 
-@dataclass
-class Processing(ProcessingData, ProcessingBase):
-    def __post_init__(self) -> None:
-        from components.utils.vins.processor import VINProcessor
+def _validate_processing(processing: ProcessingData) -> None:
+    processing.id = validate_uuid_str(processing.id)
+    processing.doc_version = to_int(processing.doc_version)
+
+    if not isinstance(processing.metadata, dict):
+        raise ValueError("metadata", "'metadata' must be a dict")
 
-        self.id = validate_uuid_str(self.id)
-        self.doc_version = to_int(self.doc_version)
+    if not isinstance(processing.created, str) or strip_str(processing.created) == "":
+        raise ValueError("created", "'created' must be a non-empty string")
 
-        if not isinstance(self.metadata, dict):
-            raise ValueError("metadata", "'metadata' must be a dict")
+    processing.assigned_user = validate_uuid_str(processing.assigned_user)
 
-        if not isinstance(self.created, str) or to_str(self.created.strip()) == "":
-            raise ValueError("created", "'created' must be a non-empty string")
+    if processing.location is not None:
+        location_type = type(processing.location)
+        if location_type is dict or location_type is Location:
+            processing.location = to_location(processing.location)
+        else:
+            raise TypeError(
+                "location",
+                f"'location' must be Location, dict or None, got {type(processing.location).__name__}",
+            )
 
-        self.assigned_user = validate_uuid_str(self.assigned_user)
+    if processing.vin is not None:
+        if not isinstance(processing.vin, str) or strip_str(processing.vin) == "":
+            raise TypeError(
+                "vin",
+                f"'vin' must be non-empty string, got {type(processing.vin).__name__}",
+            )
+        processing.vin = strip_str(processing.vin)
+        if not VINProcessor.validate(processing.vin):
+            raise ValueError("vin", "'vin' is not a valid VIN")
 
-        if self.location is not None:
-            if isinstance(self.location, (dict, Location)):
-                self.location = to_location(self.location)
-            else:
-                raise TypeError(
-                    "location",
-                    f"'location' must be Location, dict or None, got {type(self.location).__name__}",
-                )
+    processing.assets = to_assets(processing.assets)
 
-        if self.vin is not None:
-            if not isinstance(self.vin, str) or to_str(self.vin.strip()) == "":
-                raise TypeError(
-                    "vin",
-                    f"'vin' must be non-empty string, got {type(self.vin).__name__}",
-                )
-            self.vin = to_str(self.vin.strip())
-            if not VINProcessor.validate(self.vin):
-                raise ValueError("vin", "'vin' is not a valid VIN")
 
-        self.assets = to_assets(self.assets)
+@dataclass
+class Processing(ProcessingData, ProcessingBase):
+    def __post_init__(self) -> None:
+        _validate_processing(self)
+
+    @classmethod
+    def from_document(cls, doc: dict) -> "Processing":
+        # Stored documents were validated on write, skip __post_init__
+        processing = construct_trusted(cls, doc)
+        processing.assets = [
+            a if isinstance(a, Asset) else construct_trusted(Asset, a)
+            for a in processing.assets or []
+        ]
+        if isinstance(processing.location, dict):
+            processing.location = construct_trusted(Location, processing.location)
+        return processing
 
 
 @dataclass
@@ -74,4 +91,4 @@ class ProcessingAdd(ProcessingData):
     doc_version: int = field(default=0, init=False)
 
     def __post_init__(self) -> None:
-        Processing(**asdict(self))
+        _validate_processing(self)
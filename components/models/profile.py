@@ -1,11 +1,16 @@
 from .vault import Vault
-from components.models.helpers import email_validator, to_bool, to_str
+from components.models.helpers import (
+    PatchTemplate,
+    email_validator,
+    to_bool,
+    strip_str,
+)
 from components.utils.datetimes import utc_now_as_str
-from components.utils.misc import ensure_list, unique_list
-from dataclasses import dataclass, field, fields, replace
+from components.utils.misc import ensure_unique_list
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfileData:
     updated: str = field(default_factory=utc_now_as_str)
     vault: Vault | dict | None = None
@@ -16,19 +21,24 @@ class UserProfileData:
     permit_auth_requests: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile(UserProfileData):
     def __post_init__(self) -> None:
-        for name in ("first_name", "last_name", "email", "updated"):
-            if getattr(self, name):
-                setattr(self, name, to_str(getattr(self, name).strip()) or None)
-
-        access_tokens = unique_list(ensure_list(self.access_tokens))
+        if self.first_name:
+            self.first_name = strip_str(self.first_name) or None
+        if self.last_name:
+            self.last_name = strip_str(self.last_name) or None
+        if self.email:
+            self.email = strip_str(self.email) or None
+        if self.updated:
+            self.updated = strip_str(self.updated) or None
+
+        access_tokens = ensure_unique_list(self.access_tokens)
         self.access_tokens = []
         for token in access_tokens:
             if not token:
                 continue
-            elif isinstance(token, str) and len(token) > 15:
+            elif type(token) is str and len(token) > 15:
                 self.access_tokens.append(token)
             else:
                 raise ValueError(
@@ -46,17 +56,7 @@ class UserProfile(UserProfileData):
 
 
 @dataclass
-class UserProfilePatch(UserProfileData):
+class UserProfilePatch(UserProfileData, PatchTemplate):
     access_tokens: list[str | None] | str | None = None
     permit_auth_requests: bool | None = None
     updated: str = field(default_factory=utc_now_as_str, init=False)
-
-    def dump_patched(self):
-        return {
-            f.name: getattr(self, f.name)
-            for f in fields(self)
-            if getattr(self, f.name) is not None
-        }
-
-    def merge(self, original: UserProfile):
-        return replace(original, **self.dump_patched())
@@ -1,6 +1,6 @@
 from components.utils.datetimes import utc_now_as_str
-from components.models.helpers import to_str, to_int
-from dataclasses import dataclass, field, fields
+from components.models.helpers import PatchTemplate, strip_str, to_int
+from dataclasses import dataclass, field
 from config.defaults import CLAUDE_DEFAULT_MODEL
 
 
@@ -20,17 +20,10 @@ class SystemSettingsData:
 
 
 @dataclass
-class SystemSettingsPatch(SystemSettingsData):
+class SystemSettingsPatch(SystemSettingsData, PatchTemplate):
     id: str = field(default=None, init=False, repr=False)
     updated: str = field(default_factory=utc_now_as_str, init=False)
 
-    def dump_patched(self):
-        return {
-            f.name: getattr(self, f.name)
-            for f in fields(self)
-            if getattr(self, f.name) is not None
-        }
-
 
 @dataclass
 class SystemSettings(SystemSettingsData, SystemSettingsBase):
@@ -38,15 +31,13 @@ class SystemSettings(SystemSettingsData, SystemSettingsBase):
         if not self.id == "1":
             raise ValueError("id", "'id' must be '1'")
 
-        if not isinstance(self.updated, str) or to_str(self.updated.strip()) == "":
+        if not isinstance(self.updated, str) or strip_str(self.updated) == "":
             raise ValueError("updated", "'updated' must be a non-empty string")
 
         self.doc_version = to_int(self.doc_version)
 
         if self.claude_api_key is not None:
-            self.claude_api_key = to_str(self.claude_api_key.strip()) or None
+            self.claude_api_key = strip_str(self.claude_api_key) or None
 
         if self.claude_model is not None:
-            self.claude_model = (
-                to_str(self.claude_model.strip()) or CLAUDE_DEFAULT_MODEL
-            )
+            self.claude_model = strip_str(self.claude_model) or CLAUDE_DEFAULT_MODEL
@@ -1,10 +1,11 @@
+from collections import defaultdict
 from components.utils.misc import ensure_list
 from components.models.helpers import to_str, to_int
 from dataclasses import dataclass, field
 from config.defaults import TABLE_PAGE_SIZE
 
 
-@dataclass
+@dataclass(slots=True)
 class TableSearch:
     q: str = ""
     page: str | int = 1
@@ -37,16 +38,12 @@ class TableSearch:
         if isinstance(v, dict):
             return v
 
-        filters = {}
+        filters = defaultdict(list)
         for f in ensure_list(v):
             if f == "":
                 continue
-            key_name, key_value = f.split(":", 1)
-            if key_name not in filters:
-                filters[key_name] = key_value
-            else:
-                if isinstance(filters[key_name], list):
-                    filters[key_name].append(key_value)
-                else:
-                    filters[key_name] = [filters[key_name], key_value]
-        return filters
+            key_name, sep, key_value = f.partition(":")
+            if not sep:
+                raise ValueError("filters", f"Invalid filter {f!r}")
+            filters[key_name].append(key_value)
+        return {k: (vs[0] if len(vs) == 1 else vs) for k, vs in filters.items()}
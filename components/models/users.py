@@ -1,15 +1,25 @@
 from .credentials import Credential, CredentialAdd
 from .profile import UserProfile
-from components.models.helpers import to_str, to_int, validate_uuid_str, to_bool
+from .vault import Vault
+from components.models.helpers import (
+    PatchTemplate,
+    construct_trusted,
+    shallow_fields,
+    strip_str,
+    to_int,
+    validate_uuid_list,
+    validate_uuid_str,
+    to_bool,
+)
 from components.utils.datetimes import ntime_utc_now, utc_now_as_str
-from components.utils.misc import ensure_list, unique_list
-from dataclasses import asdict, dataclass, field, fields, replace
-from typing import Protocol
+from components.utils.misc import ensure_unique_list
+from dataclasses import dataclass, field
 
 USER_ACLS = ["user", "system"]
+USER_ACLS_SET = frozenset(USER_ACLS)
 
 
-@dataclass
+@dataclass(slots=True)
 class UsersPagination:
     page: int | str
     page_size: int | str
@@ -19,9 +29,9 @@ class UsersPagination:
     elements: int | str = 0
 
     def __post_init__(self) -> None:
-        for name in ("page_size", "pages", "elements"):
-            setattr(self, name, to_int(getattr(self, name)))
-
+        self.page_size = to_int(self.page_size)
+        self.pages = to_int(self.pages)
+        self.elements = to_int(self.elements)
         self.page = to_int(self.page) or 1
         self.sort_reverse = to_bool(self.sort_reverse)
 
@@ -48,10 +58,93 @@ class UserData:
     )
     acl: list[str | None] | str = field(default_factory=list)
     groups: list[str | None] | str = field(default_factory=list)
-    profile: UserProfile | dict = field(default_factory=UserProfile)
+    profile: UserProfile | dict | None = None
     active: bool = True
 
 
+def _validate_groups(groups: list[str | None] | str) -> list[str]:
+    groups = ensure_unique_list(groups)
+    for item in groups:
+        if type(item) is not str or not item:
+            raise ValueError("groups", "'groups' must contain non-empty strings")
+    return groups
+
+
+def _validate_acl(acl: list[str | None] | str) -> list[str]:
+    acls = []
+    for item in ensure_unique_list(acl):
+        if not item:
+            continue
+        elif item in USER_ACLS_SET:
+            acls.append(item)
+        else:
+            raise ValueError("acl", "'acl' must contain a user ACL")
+    return acls
+
+
+def _validate_login(login: str) -> str:
+    login = strip_str(login)
+    if len(login) < 3 or "@" in login:
+        raise ValueError(
+            "login",
+            "'login' must be at least 3 characters long and not contain '@'",
+        )
+    return login
+
+
+def _validate_credentials(
+    credentials: list[Credential | CredentialAdd | dict | None] | str,
+) -> list[Credential | CredentialAdd]:
+    if credentials == "" or credentials == []:
+        return []
+
+    validated = []
+    seen_ids = set()
+    for credential in credentials:
+        if isinstance(credential, dict):
+            credential_id = credential.get("id")
+        elif isinstance(credential, (Credential, CredentialAdd)):
+            credential_id = credential.id
+        else:
+            raise TypeError(
+                "credentials",
+                f"Invalid type for 'credentials': {type(credential).__name__}",
+            )
+
+        if isinstance(credential_id, bytes):
+            credential_id = credential_id.hex()
+        if credential_id in seen_ids:
+            continue
+        seen_ids.add(credential_id)
+
+        if isinstance(credential, dict):
+            credential = Credential(**credential)
+        validated.append(credential)
+    return validated
+
+
+def _validate_profile(profile: UserProfile | dict | None) -> UserProfile:
+    if profile is None:
+        return UserProfile()
+    elif isinstance(profile, dict):
+        return UserProfile(**profile)
+    elif not isinstance(profile, UserProfile):
+        raise TypeError(
+            "profile", f"Invalid type for 'profile': {type(profile).__name__}"
+        )
+    return profile
+
+
+USER_FIELD_VALIDATORS = {
+    "groups": _validate_groups,
+    "acl": _validate_acl,
+    "login": _validate_login,
+    "active": to_bool,
+    "credentials": _validate_credentials,
+    "profile": _validate_profile,
+}
+
+
 @dataclass
 class User(UserData, UserBase):
     def __post_init__(self) -> None:
@@ -64,52 +157,28 @@ class User(UserData, UserBase):
         if not isinstance(self.created, str) or self.created == "":
             raise ValueError("created", "'created' must be a non-empty string")
 
-        self.groups = unique_list(ensure_list(self.groups))
-        if not all(isinstance(item, str) and len(item) > 0 for item in self.groups):
-            raise ValueError("groups", "'groups' must contain non-empty strings")
-
-        acls = unique_list(ensure_list(self.acl))
-        self.acl = []
-        for acl in acls:
-            if not acl:
-                continue
-            elif acl in USER_ACLS:
-                self.acl.append(acl)
-            else:
-                raise ValueError("acl", "'acl' must contain a user ACL")
-
-        self.login = to_str(self.login.strip())
-        if len(self.login) < 3 or "@" in self.login:
-            raise ValueError(
-                "login",
-                "'login' must be at least 3 characters long and not contain '@'",
-            )
-
+        self.groups = _validate_groups(self.groups)
+        self.acl = _validate_acl(self.acl)
+        self.login = _validate_login(self.login)
         self.active = to_bool(self.active)
-
-        if self.credentials == "":
-            self.credentials = []
-        elif self.credentials != []:
-            credentials = []
-            for credential in self.credentials:
-                if credential not in credentials:
-                    if isinstance(credential, dict):
-                        credentials.append(Credential(**credential))
-                    elif isinstance(credential, (Credential, CredentialAdd)):
-                        credentials.append(credential)
-                    else:
-                        raise TypeError(
-                            "credentials",
-                            f"Invalid type for 'credentials': {type(credential).__name__}",
-                        )
-            self.credentials = credentials
-
-        if isinstance(self.profile, dict):
-            self.profile = UserProfile(**self.profile)
-        elif not isinstance(self.profile, UserProfile):
-            raise TypeError(
-                "profile", f"Invalid type for 'profile': {type(self.profile).__name__}"
-            )
+        self.credentials = _validate_credentials(self.credentials)
+        self.profile = _validate_profile(self.profile)
+
+    @classmethod
+    def from_document(cls, doc: dict) -> "User":
+        # Stored documents were validated on write, skip __post_init__
+        user = construct_trusted(cls, doc)
+        user.credentials = [
+            c if isinstance(c, Credential) else construct_trusted(Credential, c)
+            for c in user.credentials or []
+        ]
+        if user.profile is None:
+            user.profile = UserProfile()
+        elif isinstance(user.profile, dict):
+            user.profile = construct_trusted(UserProfile, user.profile)
+            if isinstance(user.profile.vault, dict):
+                user.profile.vault = construct_trusted(Vault, user.profile.vault)
+        return user
 
 
 @dataclass
@@ -118,17 +187,18 @@ class UserAdd:
     login: str
     credentials: list[CredentialAdd]
     active: bool = True
-    updated: str = field(default_factory=utc_now_as_str, init=False)
+    updated: str = field(default=None, init=False)
     created: str = field(default_factory=utc_now_as_str, init=False)
     doc_version: int = field(default=0, init=False)
     profile: UserProfile | dict = field(default_factory=UserProfile)
 
     def __post_init__(self):
-        User(**asdict(self))
+        self.updated = self.created
+        User(**shallow_fields(self))
 
 
 @dataclass
-class UserPatch(UserData):
+class UserPatch(UserData, PatchTemplate):
     id: str = field(default=None, init=False, repr=False)
     login: str | None = None
     credentials: list[Credential | CredentialAdd | dict | None] | None = None
@@ -137,18 +207,15 @@ class UserPatch(UserData):
     active: bool | None = None
     updated: str = field(default_factory=utc_now_as_str, init=False)
 
-    def dump_patched(self):
-        return {
-            f.name: getattr(self, f.name)
-            for f in fields(self)
-            if getattr(self, f.name) is not None
-        }
-
-    def merge(self, original: Protocol):
-        return replace(original, **self.dump_patched())
+    def merge(self, original: User) -> User:
+        # Only re-validate the patched fields instead of the whole user
+        for name, value in self.dump_patched().items():
+            validator = USER_FIELD_VALIDATORS.get(name)
+            setattr(original, name, validator(value) if validator else value)
+        return original
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSession:
     id: str
     login: str
@@ -159,23 +226,21 @@ class UserSession:
     login_ts: float = field(default_factory=ntime_utc_now)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserGroups:
     name: str
     new_name: str
     members: list[str] | str
 
     def __post_init__(self) -> None:
-        self.name = to_str(self.name.strip())
+        self.name = strip_str(self.name)
         if len(self.name) < 1:
             raise ValueError("name", "'name' must be at least 1 character long")
 
-        self.new_name = to_str(self.new_name.strip())
+        self.new_name = strip_str(self.new_name)
         if len(self.new_name) < 1:
             raise ValueError("new_name", "'new_name' must be at least 1 character long")
 
-        self.members = [
-            validate_uuid_str(u) for u in unique_list(ensure_list(self.members))
-        ]
+        self.members = validate_uuid_list(self.members)
         if not self.members:
             raise ValueError("members", "'members' must not be empty")
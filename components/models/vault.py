@@ -1,8 +1,8 @@
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 from components.models.helpers import to_str
 
 
-@dataclass
+@dataclass(slots=True)
 class Vault:
     public_key_pem: str
     wrapped_private_key: str
@@ -10,5 +10,7 @@ class Vault:
     salt: str
 
     def __post_init__(self) -> None:
-        for f in fields(self):
-            setattr(self, f, to_str(getattr(self, f)))
+        self.public_key_pem = to_str(self.public_key_pem)
+        self.wrapped_private_key = to_str(self.wrapped_private_key)
+        self.iv = to_str(self.iv)
+        self.salt = to_str(self.salt)
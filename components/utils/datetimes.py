@@ -1,5 +1,6 @@
 import os
-from datetime import datetime, timezone, UTC, timedelta
+import time
+from datetime import datetime, UTC, timedelta
 
 
 def system_now_as_str():
@@ -10,8 +11,23 @@ def ntime_utc_now():
     return datetime.now(UTC).timestamp()
 
 
-def utc_now_as_str(dtformat="%Y-%m-%dT%H:%M:%S%z"):
-    return datetime.now(timezone.utc).strftime(dtformat)
+UTC_NOW_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+_utc_now_cache = (None, "")
+
+
+def utc_now_as_str(dtformat=UTC_NOW_FORMAT):
+    global _utc_now_cache
+    if dtformat != UTC_NOW_FORMAT:
+        return datetime.now(UTC).strftime(dtformat)
+
+    # The default format has second resolution, reuse the string within a second
+    now = int(time.time())
+    if _utc_now_cache[0] != now:
+        _utc_now_cache = (
+            now,
+            datetime.fromtimestamp(now, UTC).strftime(dtformat),
+        )
+    return _utc_now_cache[1]
 
 
 def last_modified_http(file):
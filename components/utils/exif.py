@@ -1,15 +1,52 @@
 import math
 
-from PIL import Image
-from PIL.ExifTags import GPSTAGS, TAGS
+from PIL import Image, UnidentifiedImageError
+from PIL.ExifTags import GPSTAGS, IFD
 from io import BytesIO
 
+GPS_TAGS = frozenset(
+    {
+        "GPSLatitude",
+        "GPSLongitude",
+        "GPSLatitudeRef",
+        "GPSLongitudeRef",
+    }
+)
+GPS_COORD_TAGS = frozenset({"GPSLatitude", "GPSLongitude"})
+# EXIF lives in the leading APP1 segment of JPEGs, look there before the full file
+EXIF_HEAD_SIZE = 64 * 1024
+JPEG_MAGIC = b"\xff\xd8"
+
+
+def may_have_exif(image_bytes: bytes) -> bool:
+    # GIF and BMP have no EXIF, WebP announces it with a flag in its VP8X header
+    if image_bytes.startswith((b"GIF8", b"BM")):
+        return False
+    if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+        flags = image_bytes[20:21]
+        return image_bytes[12:16] == b"VP8X" and bool(flags and flags[0] & 0x08)
+    return True
+
 
 class ImageExif:
     def __init__(self, image_bytes: bytes):
-        self.image = Image.open(BytesIO(image_bytes))
+        if not may_have_exif(image_bytes):
+            raise ValueError("No EXIF data")
+
         self.gps_info = {}
-        self.exif_data = self.image._getexif()
+        self.exif_data = None
+        if len(image_bytes) > EXIF_HEAD_SIZE and image_bytes.startswith(JPEG_MAGIC):
+            try:
+                self.image = Image.open(BytesIO(image_bytes[:EXIF_HEAD_SIZE]))
+                self.exif_data = self.image.getexif()
+            except (OSError, SyntaxError, UnidentifiedImageError):
+                # Truncated head, fall back to the full file below
+                pass
+
+        if not self.exif_data:
+            self.image = Image.open(BytesIO(image_bytes))
+            self.exif_data = self.image.getexif()
+
         if not self.exif_data:
             raise ValueError("No EXIF data")
 
@@ -35,22 +72,13 @@ class ImageExif:
         return False
 
     def _load_gps_info(self):
-        for exif_tag, exif_value in self.exif_data.items():
-            if TAGS.get(exif_tag, exif_tag) == "GPSInfo":
-                for gps_key, gps_value in exif_value.items():
-                    gps_tag = GPSTAGS.get(gps_key, gps_key)
-                    if gps_tag in [
-                        "GPSLatitude",
-                        "GPSLongitude",
-                        "GPSLatitudeRef",
-                        "GPSLongitudeRef",
-                    ]:
-                        if gps_tag in [
-                            "GPSLatitude",
-                            "GPSLongitude",
-                        ] and self._is_invalid_gps(gps_value):
-                            return {}
-                        self.gps_info[gps_tag] = gps_value
+        # Read the GPS IFD directly instead of scanning every EXIF tag
+        for gps_key, gps_value in self.exif_data.get_ifd(IFD.GPSInfo).items():
+            gps_tag = GPSTAGS.get(gps_key, gps_key)
+            if gps_tag in GPS_TAGS:
+                if gps_tag in GPS_COORD_TAGS and self._is_invalid_gps(gps_value):
+                    return {}
+                self.gps_info[gps_tag] = gps_value
 
     @property
     def lat_lon(self):
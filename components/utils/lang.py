@@ -1,22 +1,41 @@
-import json
 import os
 import sys
 
+from components.utils.misc import json_loads
 from config.defaults import ACCEPT_LANGUAGES
 
 _main_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+_parsed: dict[str, dict] = {}
 
-class LangDict(dict):
-    def __init__(self, lang="en", **kwargs):
-        if lang != "en":
-            with open(f"{_main_dir}/lang/{lang}.json", encoding="utf-8") as f:
-                data = json.load(f)
-            super().__init__(data, **kwargs)
-        else:
-            super().__init__(**kwargs)
 
+def _load(path: str) -> dict:
+    if path not in _parsed:
+        with open(path, "rb") as f:
+            raw = f.read()
+        _parsed[path] = json_loads(raw)
+    return _parsed[path]
+
+
+class LangDict(dict):
     def __missing__(self, key):
         return key
 
 
-LANG = {k: LangDict(lang=k) for k in ACCEPT_LANGUAGES}
+def _lang_dict(lang: str) -> LangDict:
+    if lang != "en":
+        return LangDict(_load(f"{_main_dir}/lang/{lang}.json"))
+    # English strings are their own keys, seeding them keeps template lookups
+    # on the plain dict path instead of falling through to __missing__
+    return LangDict(
+        (key, key)
+        for k in ACCEPT_LANGUAGES
+        if k != "en"
+        for key in _load(f"{_main_dir}/lang/{k}.json")
+    )
+
+
+LANG = {k: _lang_dict(k) for k in ACCEPT_LANGUAGES}
+
+
+def t(lang: str, key: str) -> str:
+    return LANG.get(lang, LANG["en"]).get(key, key)
@@ -1,23 +1,55 @@
+import json
 import os
 import sys
+from collections.abc import Iterable
+from itertools import islice
 from typing import Any
 
 __all__ = [
     "batch",
     "ensure_list",
+    "ensure_unique_list",
     "unique_list",
     "to_unique_sorted_str_list",
     "is_path_within_cwd",
+    "json_dumps",
+    "json_loads",
 ]
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def batch(lst: list, n: int):
-    _l = len(lst)
-    for ndx in range(0, _l, n):
-        yield lst[ndx : min(ndx + n, _l)]
+
+def json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, callers catch either
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def batch(lst: Iterable, n: int):
+    if isinstance(lst, (list, tuple)):
+        # Slicing already clamps at the end of the list
+        for ndx in range(0, len(lst), n):
+            yield lst[ndx : ndx + n]
+        return
+    it = iter(lst)
+    while chunk := list(islice(it, n)):
+        yield chunk
 
 
 def ensure_list(x: Any) -> list:
+    # Lists are the common case, hand them back without a copy
+    if type(x) is list:
+        return x
     if isinstance(x, (list, tuple, set)):
         return list(x)
     if isinstance(x, (str, dict)):
@@ -25,20 +57,29 @@ def ensure_list(x: Any) -> list:
     return []
 
 
+def ensure_unique_list(x: Any) -> list:
+    if isinstance(x, (str, dict)):
+        return [x]
+    if isinstance(x, (list, tuple, set)):
+        return list(dict.fromkeys(x))
+    return []
+
+
 def unique_list(lst: list[Any] | set[Any]) -> list:
     if isinstance(lst, list):
         return list(dict.fromkeys(lst))
-    elif isinstance(lst, set):
+    if isinstance(lst, set):
         return list(lst)
     raise TypeError("Input is not a list or set")
 
 
 def to_unique_sorted_str_list(lst: list[Any]) -> list:
-    _lst = [str(x) for x in set(lst) if x]
-    return sorted(_lst)
+    return sorted({str(x) for x in lst if x})
+
+
+_main_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
 
 
 def is_path_within_cwd(path):
     requested_path = os.path.abspath(path)
-    main_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-    return requested_path.startswith(main_dir)
+    return os.path.commonpath([_main_dir, requested_path]) == _main_dir
@@ -1,11 +1,95 @@
-import json
+import asyncio
+import threading
+import time
+import weakref
 
 from .requests import async_request, sync_request
-from components.database.states import STATE
+from collections import OrderedDict
 from components.logs import logger
+from components.utils.misc import json_loads
 from config.defaults import HOSTNAME, OSM_EMAIL
 from urllib.parse import urlencode, quote_plus
 
+LOCATION_CACHE_SIZE = 10_000
+LOCATION_CACHE_TTL = 86400
+NOMINATIM_MIN_INTERVAL = 1.0  # Nominatim usage policy: max. 1 request per second
+
+
+class _TTLCache:
+    def __init__(self, max_entries: int, ttl: float):
+        self.max = max_entries
+        self.ttl = ttl
+        self.od: "OrderedDict[str, tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self.od.get(key)
+            if entry is None:
+                return None
+            expires, val = entry
+            if expires < time.monotonic():
+                del self.od[key]
+                return None
+            self.od.move_to_end(key)
+            return val
+
+    def put(self, key, val):
+        with self._lock:
+            self.od[key] = (time.monotonic() + self.ttl, val)
+            self.od.move_to_end(key)
+            if len(self.od) > self.max:
+                self.od.popitem(last=False)
+
+
+class _RequestSpacer:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        # Hand out start slots at least `interval` apart, returns the wait time
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+            return start - now
+
+    def try_now(self) -> bool:
+        # Claim a slot only if one is free right away, never sleeps
+        with self._lock:
+            now = time.monotonic()
+            if self._next_start > now:
+                return False
+            self._next_start = now + self.interval
+            return True
+
+    async def await_turn(self):
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+_LOC_CACHE = _TTLCache(LOCATION_CACHE_SIZE, LOCATION_CACHE_TTL)
+_nominatim_spacer = _RequestSpacer(NOMINATIM_MIN_INTERVAL)
+_inflight: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _normalize_coords(lat: float, lon: float) -> str:
+    # 5 decimals is ~1 m, close fixes of the same spot share one entry
+    return f"{lat:.5f},{lon:.5f}"
+
+
+def _inflight_lock(key: str) -> asyncio.Lock:
+    lock = _inflight.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _inflight[key] = lock
+    return lock
+
 
 class CoordsResolver:
     def __init__(self, coords: str):
@@ -21,25 +105,31 @@ class CoordsResolver:
         except (ValueError, TypeError, AssertionError):
             raise ValueError(f"Invalid coordinate string: {coords}")
 
-        self.display_name = None
-        if STATE.locations.get(coords):
-            self.display_name = STATE.locations[coords]
+        self.key = _normalize_coords(self.lat, self.lon)
+        self.display_name = _LOC_CACHE.get(self.key)
 
     def resolve(self, force: bool = False):
+        # Blocking variant for synchronous callers, prefer aresolve() elsewhere
         if self.display_name and not force:
             return self.display_name
+        # Runs inside model validation on the event loop, so it must not wait
+        # for a request slot: skip the lookup while other lookups are queued
+        if not _nominatim_spacer.try_now():
+            return None
         try:
-            status_code, response_text = sync_request(
-                f"https://nominatim.openstreetmap.org/reverse?lat={self.lat}&lon={self.lon}&format=json&addressdetails=0&email={OSM_EMAIL}",
+            status_code, response_body = sync_request(
+                f"https://nominatim.openstreetmap.org/reverse?lat={self.lat}&lon={self.lon}&format=json&addressdetails=0&zoom=18&email={OSM_EMAIL}",
                 "GET",
                 headers={
                     "User-Agent": f"coords_to_display_name() - Thank you! - Contact: {OSM_EMAIL}",
                     "Referer": f"https://{HOSTNAME}",
+                    "Accept-Encoding": "gzip",
                 },
+                raw=True,
             )
             if status_code == 200:
-                response_text = json.loads(response_text)
-                STATE.locations[self.coords] = response_text["display_name"]
+                response_text = json_loads(response_body)
+                _LOC_CACHE.put(self.key, response_text["display_name"])
                 return response_text["display_name"]
         except Exception as e:
             logger.error(f"Cannot resolve coords: {e}")
@@ -49,18 +139,29 @@ class CoordsResolver:
         if self.display_name and not force:
             return self.display_name
 
+        async with _inflight_lock(self.key):
+            if not force:
+                self.display_name = _LOC_CACHE.get(self.key)
+                if self.display_name:
+                    return self.display_name
+            return await self._aresolve()
+
+    async def _aresolve(self):
         try:
-            status_code, response_text = await async_request(
-                f"https://nominatim.openstreetmap.org/reverse?lat={self.lat}&lon={self.lon}&format=json&addressdetails=0&email={OSM_EMAIL}",
+            await _nominatim_spacer.await_turn()
+            status_code, response_body = await async_request(
+                f"https://nominatim.openstreetmap.org/reverse?lat={self.lat}&lon={self.lon}&format=json&addressdetails=0&zoom=18&email={OSM_EMAIL}",
                 "GET",
                 headers={
                     "User-Agent": f"coords_to_display_name() - Thank you! - Contact: {OSM_EMAIL}",
                     "Referer": f"https://{HOSTNAME}",
+                    "Accept-Encoding": "gzip",
                 },
+                raw=True,
             )
             if status_code == 200:
-                response_text = json.loads(response_text)
-                STATE.locations[self.coords] = response_text["display_name"]
+                response_text = json_loads(response_body)
+                _LOC_CACHE.put(self.key, response_text["display_name"])
                 return response_text["display_name"]
         except Exception as e:
             logger.error(f"Cannot resolve coords: {e}")
@@ -68,8 +169,6 @@ class CoordsResolver:
 
 
 async def display_name_to_location(q: str | dict) -> dict:
-    from components.database.states import STATE
-
     if not isinstance(q, (str, dict)):
         raise ValueError(f"'q' must be a string or dict, got {type(q).__name__}.")
 
@@ -85,33 +184,61 @@ async def display_name_to_location(q: str | dict) -> dict:
     if isinstance(q, dict):
         for attr in q:
             if q[attr] is not None and attr in ["country", "city", "street"]:
-                clean_text = q[attr].strip()
+                clean_text = q[attr].strip().lower()
                 if clean_text:
                     data[attr] = clean_text
     else:
-        data["q"] = q.strip()
+        data["q"] = q.strip().lower()
 
-    query_string = urlencode(data, quote_via=quote_plus)
+    query_string = urlencode(sorted(data.items()), quote_via=quote_plus)
+
+    result = _LOC_CACHE.get(query_string)
+    if result is not None:
+        return result
+
+    async with _inflight_lock(query_string):
+        result = _LOC_CACHE.get(query_string)
+        if result is not None:
+            return result
 
-    if query_string in STATE.locations:
-        return STATE.locations[query_string]
-    else:
         result = {}
-        status_code, response_text = await async_request(
+        await _nominatim_spacer.await_turn()
+        status_code, response_body = await async_request(
             f"https://nominatim.openstreetmap.org/search?{query_string}",
             "GET",
             headers={
                 "User-Agent": f"display_name_to_location() - Thank you! - Contact: {OSM_EMAIL}",
                 "Referer": f"https://{HOSTNAME}",
+                "Accept-Encoding": "gzip",
             },
+            raw=True,
         )
         if status_code == 200:
-            response_text = json.loads(response_text)
+            response_text = json_loads(response_body)
 
             if response_text:
                 result = response_text[0]
-                STATE.locations[query_string] = result
+                _LOC_CACHE.put(query_string, result)
 
             return result
 
         return result
+
+
+async def resolve_many(coords: list[str], concurrency: int = 8) -> list[str | None]:
+    resolvers = [CoordsResolver(c) for c in coords]
+    misses = [r for r in resolvers if not r.display_name]
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(r: CoordsResolver):
+        # Request starts are spaced by _nominatim_spacer, the semaphore only
+        # bounds how many slow responses may be outstanding at once
+        async with sem:
+            r.display_name = await r.aresolve()
+
+    results = await asyncio.gather(*(_one(r) for r in misses), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Cannot resolve coords: {result}")
+
+    return [r.display_name for r in resolvers]
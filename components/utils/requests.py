@@ -1,7 +1,37 @@
-import asyncio
+import atexit
 import json
-import urllib.error
-import urllib.request
+
+import httpx
+
+# Bounded so a stalled upstream cannot hold a pooled connection forever,
+# generous enough for slow vision API responses
+REQUEST_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+_client = None
+_sync_client = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    # One shared client keeps connections alive between requests to the same host
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(timeout=REQUEST_TIMEOUT, follow_redirects=True)
+    return _client
+
+
+async def aclose_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _get_sync_client() -> httpx.Client:
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = httpx.Client(timeout=REQUEST_TIMEOUT, follow_redirects=True)
+        atexit.register(_sync_client.close)
+    return _sync_client
 
 
 async def async_request(
@@ -9,6 +39,7 @@ async def async_request(
     method: str,
     data: dict = {},
     headers: dict = {},
+    raw: bool = False,
 ):
     if not isinstance(url, str):
         raise ValueError(f"'url' must be a string, but got {type(url).__name__}.")
@@ -26,20 +57,10 @@ async def async_request(
             f"'headers' parameter must be a dictionary, but got {type(headers).__name__}."
         )
 
-    def _blocking_request():
-        try:
-            req = urllib.request.Request(
-                url,
-                data=(json.dumps(data).encode("utf-8") if data else None),
-                headers=headers,
-                method=method,
-            )
-            with urllib.request.urlopen(req) as response:
-                return response.getcode(), response.read().decode("utf-8")
-        except urllib.error.HTTPError as e:
-            return e.code, e.read().decode("utf-8")
+    body = json.dumps(data).encode("utf-8") if data else None
 
-    return await asyncio.to_thread(_blocking_request)
+    response = await _get_client().request(method, url, content=body, headers=headers)
+    return response.status_code, response.content if raw else response.text
 
 
 def sync_request(
@@ -47,6 +68,7 @@ def sync_request(
     method: str,
     data: dict = {},
     headers: dict = {},
+    raw: bool = False,
 ):
     if not isinstance(url, str):
         raise ValueError(f"'url' must be a string, but got {type(url).__name__}.")
@@ -64,14 +86,7 @@ def sync_request(
             f"'headers' parameter must be a dictionary, but got {type(headers).__name__}."
         )
 
-    try:
-        req = urllib.request.Request(
-            url,
-            data=(json.dumps(data).encode("utf-8") if data else None),
-            headers=headers,
-            method=method,
-        )
-        with urllib.request.urlopen(req) as response:
-            return response.getcode(), response.read().decode("utf-8")
-    except urllib.error.HTTPError as e:
-        return e.code, e.read().decode("utf-8")
+    body = json.dumps(data).encode("utf-8") if data else None
+
+    response = _get_sync_client().request(method, url, content=body, headers=headers)
+    return response.status_code, response.content if raw else response.text
@@ -4,11 +4,13 @@ from .models import DataType
 from .plugins import EXTRACTORS
 from .plugins.base import VINExtractorPlugin
 from components.logs import logger
+from components.models.system import SystemSettings
 from magic import Magic
 
+mime = Magic(mime=True)
+
 
 def _mime_type_from_bytes(data_bytes: bytes) -> str:
-    mime = Magic(mime=True)
     return mime.from_buffer(data_bytes)
 
 
@@ -26,13 +28,20 @@ def _mime_to_datatype(mime_type: str) -> DataType:
 
 class VINExtractor:
     @staticmethod
-    async def get_extractor_for_mime(mime_type: str) -> VINExtractorPlugin | None:
+    async def load_settings() -> SystemSettings:
         from components.database import db
-        from components.models.system import SystemSettings
 
         async with db:
             settings = await db.get("system_settings", "1")
-            settings = SystemSettings(**settings)
+        return SystemSettings(**settings)
+
+    @staticmethod
+    async def get_extractor_for_mime(
+        mime_type: str,
+        settings: SystemSettings | None = None,
+    ) -> VINExtractorPlugin | None:
+        if settings is None:
+            settings = await VINExtractor.load_settings()
 
         candidates = []
         required_type = _mime_to_datatype(mime_type)
@@ -63,14 +72,20 @@ class VINExtractor:
         return None
 
     @staticmethod
-    async def get_extractor_for_bytes(data_bytes: bytes) -> VINExtractorPlugin | None:
+    async def get_extractor_for_bytes(
+        data_bytes: bytes,
+        settings: SystemSettings | None = None,
+    ) -> VINExtractorPlugin | None:
         mime_type = _mime_type_from_bytes(data_bytes)
-        return await VINExtractor.get_extractor_for_mime(mime_type)
+        return await VINExtractor.get_extractor_for_mime(mime_type, settings)
 
     @staticmethod
-    async def get_extractor_for_filename(filename: str) -> VINExtractorPlugin | None:
+    async def get_extractor_for_filename(
+        filename: str,
+        settings: SystemSettings | None = None,
+    ) -> VINExtractorPlugin | None:
         mime_type = _mime_type_from_filename(filename)
-        return await VINExtractor.get_extractor_for_mime(mime_type)
+        return await VINExtractor.get_extractor_for_mime(mime_type, settings)
 
 
 __all__ = ["VINExtractor"]
@@ -10,6 +10,8 @@ from components.utils.requests import async_request
 from magic import Magic
 from typing import Any
 
+mime = Magic(mime=True)
+
 
 class ClaudeExtractor(VINExtractorPlugin):
     name = "claude"
@@ -235,7 +237,6 @@ Found in user text, appears to be from vehicle documentation"""
         ]
 
     async def _prepare_data(self, data_bytes: bytes) -> tuple[str, str, str, str]:
-        mime = Magic(mime=True)
         media_type = mime.from_buffer(data_bytes)
 
         if media_type.startswith("image/"):
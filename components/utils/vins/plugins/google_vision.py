@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import json
 from copy import deepcopy
@@ -29,6 +30,11 @@ class GoogleVisionExtractor(VINExtractorPlugin):
         self.api_key = settings.google_vision_api_key
         self.feature_types = feature_types or ["TEXT_DETECTION"]
 
+    @staticmethod
+    def _image_size(path: str) -> tuple[int, int]:
+        with Image.open(path) as img:
+            return img.size
+
     async def extract(self, data_bytes: bytes, **kwargs) -> list[VINResult]:
         asset = await Asset.from_bytes(
             data_bytes,
@@ -39,8 +45,9 @@ class GoogleVisionExtractor(VINExtractorPlugin):
             loseless=False,
             filename=kwargs.get("filename") + ".webp",
         )
-        img = Image.open(f"assets/{asset.id}")
-        image_width, image_height = img.size
+        image_width, image_height = await asyncio.to_thread(
+            self._image_size, f"assets/{asset.id}"
+        )
 
         image_data = base64.standard_b64encode(data_bytes).decode(
             "utf-8"
@@ -16,25 +16,33 @@ class TesseractExtractor(VINExtractorPlugin):
     def __init__(self, *args, **kwargs):
         pass
 
+    @staticmethod
+    def _image_to_string(data_bytes: bytes) -> str:
+        return pytesseract.image_to_string(Image.open(BytesIO(data_bytes)))
+
     async def extract(self, data_bytes: bytes, **kwargs) -> list[VINResult]:
-        asset = await Asset.from_bytes(
-            data_bytes,
-            cluster=cluster,
-            overlay=None,
-            compress=False,
-            filename=kwargs.get("filename"),
+        # Storing the asset and OCR do not depend on each other, run them together
+        asset, text = await asyncio.gather(
+            Asset.from_bytes(
+                data_bytes,
+                cluster=cluster,
+                overlay=None,
+                compress=False,
+                filename=kwargs.get("filename"),
+            ),
+            asyncio.to_thread(self._image_to_string, data_bytes),
+            return_exceptions=True,
         )
+        if isinstance(asset, BaseException):
+            raise asset
 
-        try:
-            image = Image.open(BytesIO(data_bytes))
-            text = await asyncio.to_thread(pytesseract.image_to_string, image)
-        except Exception as e:
+        if isinstance(text, Exception):
             return [
                 VINResult(
                     vin=None,
                     raw_response=None,
                     metadata={
-                        "errors": f"Tesseract Error: {e}",
+                        "errors": f"Tesseract Error: {text}",
                     },
                     asset=asset,
                 )
@@ -3,6 +3,60 @@ from . import wmi_codes
 import itertools
 import re
 
+# Matches: "VIN: 1HGBH41JXMN109186 Model"
+# \b ensures word boundaries, preventing partial matches
+VIN_PATTERN = re.compile(r"\b([A-Z0-9]{17})\b")
+
+# Matches: "1HG BH4 1JX MN1 091 86" (OCR sometimes adds spaces)
+# Allows 0-2 spaces between each character
+SPACED_VIN_PATTERN = re.compile(r"\b([A-Z0-9](?:\s{0,2}[A-Z0-9]){16})\b")
+WHITESPACE_PATTERN = re.compile(r"\s")
+
+# O, Q, I are *never* valid in a VIN
+ILLEGAL_CHAR_FIXES = str.maketrans({"O": "0", "Q": "0", "I": "1"})
+
+# Common OCR errors (B/8, S/5, T/1), used for the one-way fixes
+OCR_FIXES = {"B": "8", "S": "5", "T": "1"}
+
+# Standard VIN transliteration table for checksum
+VIN_CHAR_VALUES = {
+    **{str(d): d for d in range(10)},
+    "A": 1,
+    "B": 2,
+    "C": 3,
+    "D": 4,
+    "E": 5,
+    "F": 6,
+    "G": 7,
+    "H": 8,
+    "J": 1,
+    "K": 2,
+    "L": 3,
+    "M": 4,
+    "N": 5,
+    "P": 7,
+    "R": 9,
+    "S": 2,
+    "T": 3,
+    "U": 4,
+    "V": 5,
+    "W": 6,
+    "X": 7,
+    "Y": 8,
+    "Z": 9,
+}
+VIN_WEIGHTS = (8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+def _vin_checksum(vin: str) -> int | None:
+    checksum = 0
+    for pos, char in enumerate(vin):
+        value = VIN_CHAR_VALUES.get(char)
+        if value is None:
+            return None
+        checksum += value * VIN_WEIGHTS[pos]
+    return checksum
+
 
 class VINProcessor:
     @staticmethod
@@ -10,17 +64,10 @@ class VINProcessor:
         text_upper = text.upper()
         candidates = set()  # Use set to automatically deduplicate candidates
 
-        # Matches: "VIN: 1HGBH41JXMN109186 Model"
-        # \b ensures word boundaries, preventing partial matches
-        candidates.update(re.findall(r"\b([A-Z0-9]{17})\b", text_upper))
+        candidates.update(VIN_PATTERN.findall(text_upper))
 
-        # Matches: "1HG BH4 1JX MN1 091 86" (OCR sometimes adds spaces)
-        # Allows 0-2 spaces between each character
-        spaced_matches = re.findall(
-            r"\b([A-Z0-9](?:\s{0,2}[A-Z0-9]){16})\b", text_upper
-        )
-        for match in spaced_matches:
-            cleaned = re.sub(r"\s", "", match)  # Remove all spaces
+        for match in SPACED_VIN_PATTERN.findall(text_upper):
+            cleaned = WHITESPACE_PATTERN.sub("", match)  # Remove all spaces
             if len(cleaned) == 17:
                 candidates.add(cleaned)
 
@@ -46,21 +93,14 @@ class VINProcessor:
 
     @staticmethod
     def _repair_and_validate(vin: str, max_combinations: int = 1000000):
-        # 1. Global ILLEGAL fixes (O, Q, I are *never* valid in a VIN)
-        ILLEGAL_CHAR_FIXES = {"O": "0", "Q": "0", "I": "1"}
-
-        # 2. Renamed map for common OCR errors (B/8, S/5, T/1)
-        #    This is used for the one-way fixes.
-        OCR_FIXES = {"B": "8", "S": "5", "T": "1"}
-
         vin = vin.strip().upper()
         if len(vin) != 17:
             return None
 
-        # 3. Apply global fixes (O, Q, I) to the *entire* string
-        vin_cleaned_global = "".join(ILLEGAL_CHAR_FIXES.get(c, c) for c in vin)
+        # 1. Apply global fixes (O, Q, I) to the *entire* string
+        vin_cleaned_global = vin.translate(ILLEGAL_CHAR_FIXES)
 
-        # 4. Apply the one-way OCR fixes *only* for position 9
+        # 2. Apply the one-way OCR fixes *only* for position 9
         pos_9_char = vin_cleaned_global[8]
         vin_cleaned = (
             vin_cleaned_global[:8]
@@ -68,11 +108,11 @@ class VINProcessor:
             + vin_cleaned_global[9:]
         )
 
-        # 5. Validate this "smarter" cleaned version
+        # 3. Validate this "smarter" cleaned version
         if VINProcessor.validate(vin_cleaned):
             return vin_cleaned
 
-        # 6. If still invalid, proceed to brute-force
+        # 4. If still invalid, proceed to brute-force
 
         prefix = vin_cleaned[:12]
         suffix = vin_cleaned[12:]
@@ -103,18 +143,42 @@ class VINProcessor:
             # --- END MODIFIED PART ---
 
         # Suffix logic: ONE-WAY fixes using the OCR_FIXES map
-        suffix_options = [[OCR_FIXES.get(c, c)] for c in suffix]
-
-        # 7. Run the iterator (unchanged)
-        tried = 0
-        for pre in itertools.product(*prefix_options):
-            for suf in itertools.product(*suffix_options):
-                candidate = "".join(pre) + "".join(suf)
-                tried += 1
+        suffix = "".join(OCR_FIXES.get(c, c) for c in suffix)
+
+        # 5. Every swap shifts the checksum by a fixed amount, so candidates
+        #    with a wrong check digit are skipped without building the string.
+        #    "Z" (checksum not used) and unknown characters are left to validate()
+        check_digit = vin_cleaned[8]
+        base_checksum = _vin_checksum(prefix + suffix)
+        gated = base_checksum is not None and check_digit in "0123456789X"
+        expected = None
+        if gated:
+            expected = 10 if check_digit == "X" else int(check_digit)
+
+        options = []
+        for i, opts in enumerate(prefix_options):
+            if gated and len(opts) > 1:
+                base_value = VIN_CHAR_VALUES[opts[0]]
+                options.append(
+                    [
+                        (c, (VIN_CHAR_VALUES[c] - base_value) * VIN_WEIGHTS[i])
+                        for c in opts
+                    ]
+                )
+            else:
+                options.append([(c, 0) for c in opts])
+
+        # 6. Run the iterator
+        for tried, combination in enumerate(itertools.product(*options), 1):
+            if (
+                not gated
+                or (base_checksum + sum(d for _, d in combination)) % 11 == expected
+            ):
+                candidate = "".join(c for c, _ in combination) + suffix
                 if VINProcessor.validate(candidate):
                     return candidate
-                if tried >= max_combinations:
-                    return None
+            if tried >= max_combinations:
+                return None
 
         return None
 
@@ -174,45 +238,10 @@ class VINProcessor:
         if vin[8] == "Z":
             return True
 
-        # Standard VIN transliteration table for checksum
-        trans = {
-            "A": 1,
-            "B": 2,
-            "C": 3,
-            "D": 4,
-            "E": 5,
-            "F": 6,
-            "G": 7,
-            "H": 8,
-            "J": 1,
-            "K": 2,
-            "L": 3,
-            "M": 4,
-            "N": 5,
-            "P": 7,
-            "R": 9,
-            "S": 2,
-            "T": 3,
-            "U": 4,
-            "V": 5,
-            "W": 6,
-            "X": 7,
-            "Y": 8,
-            "Z": 9,
-        }
-        weights = (8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2)
-
-        # Calculate checksum
-        checksum = 0
-        for pos, char in enumerate(vin):
-            if char.isdigit():
-                value = int(char)
-            elif char in trans:
-                value = trans[char]
-            else:
-                # Character not in valid set
-                return False
-            checksum += value * weights[pos]
+        checksum = _vin_checksum(vin)
+        if checksum is None:
+            # Character not in valid set
+            return False
 
         # Verify check digit matches position 9
         check_digit = "X" if (checksum % 11) == 10 else str(checksum % 11)
@@ -9,13 +9,13 @@ from components.database import db
 from components.database.states import STATE
 from components.models.forms import model_forms
 from components.models.users import User
-from components.utils.lang import LANG
+from components.utils.lang import LANG, t
 from components.utils.misc import ensure_list
+from components.utils.requests import aclose_client
 from components.web.utils.notifications import trigger_notification
 from components.web.utils.utils import build_nested_dict, ws_hyperscript
 from config import defaults
 from quart import Quart, request, session
-from dataclasses import asdict
 
 app = Quart(
     __name__,
@@ -42,11 +42,17 @@ app.config["MOD_REQ_LIMIT"] = 10
 
 modifying_request_limiter = asyncio.Semaphore(app.config["MOD_REQ_LIMIT"])
 
+FORM_ID_CHARS = string.ascii_lowercase + string.digits
+
 
 def generate_form_id(from_key: str, length=8):
-    chars = string.ascii_lowercase + string.digits
-    random_part = "".join(random.choices(chars, k=length))
-    return f"form-{random_part}-{str(from_key)}"
+    random_part = "".join(random.choices(FORM_ID_CHARS, k=length))
+    return f"form-{random_part}-{from_key}"
+
+
+@app.after_serving
+async def close_http_client():
+    await aclose_client()
 
 
 @app.errorhandler(ValueError)
@@ -79,20 +85,20 @@ async def handle_input_error(error):
             level="validationError",
             response_body=""
             if not request.headers.get("Hx-Request")
-            else f"{LANG[request.USER_LANG]['Data validation failed']}\n{LANG[request.USER_LANG][message]}\n",
+            else f"{t(request.USER_LANG, 'Data validation failed')}\n{t(request.USER_LANG, message)}\n",
             response_code=422,
-            title=LANG[request.USER_LANG]["Data validation failed"],
-            message=LANG[request.USER_LANG][message],
+            title=t(request.USER_LANG, "Data validation failed"),
+            message=t(request.USER_LANG, message),
             fields=ensure_list(fields),
         )
     return trigger_notification(
         level="validationError",
         response_body=""
         if not request.headers.get("Hx-Request")
-        else f"{LANG[request.USER_LANG]['Data validation failed']}\n{LANG[request.USER_LANG][str(error)]}\n",
+        else f"{t(request.USER_LANG, 'Data validation failed')}\n{t(request.USER_LANG, str(error))}\n",
         response_code=422,
-        title=LANG[request.USER_LANG]["Data validation failed"],
-        message=LANG[request.USER_LANG][str(error)],
+        title=t(request.USER_LANG, "Data validation failed"),
+        message=t(request.USER_LANG, str(error)),
     )
 
 
@@ -110,13 +116,13 @@ async def before_request():
         async with db:
             user = await db.get("users", session["id"])
             if "system" not in ensure_list(user.get("acl", [])):
-                user = User(**user)
-                user.acl.append("system")
+                user = User.from_document(user)
+                # Build a new list, the loaded document is shared with the cache
+                user.acl = [*user.acl, "system"]
                 session["acl"] = user.acl
                 STATE.session_validated.update({session["id"]: user.acl})
-                user_dict = asdict(user)
                 try:
-                    await db.patch("users", session["id"], {"acl": user_dict["acl"]})
+                    await db.patch("users", session["id"], {"acl": user.acl})
                 except Exception:
                     await ws_hyperscript(
                         session["login"],
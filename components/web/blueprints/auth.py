@@ -17,7 +17,7 @@ from components.web.utils.passkeys import (
 from components.web.utils.utils import ws_hyperscript
 from components.web.utils.wrappers import acl, session_clear
 from config import defaults
-from dataclasses import asdict
+from components.models.helpers import shallow_asdict
 from quart import Blueprint, render_template, request, session
 from secrets import token_urlsafe
 from uuid import uuid4
@@ -158,7 +158,7 @@ async def login_request_check(request_token: str):
 
         user = User(**user[0])
 
-        for k, v in asdict(
+        for k, v in shallow_asdict(
             UserSession(
                 login=user.login,
                 id=user.id,
@@ -232,7 +232,7 @@ async def login_token_verify():
 
     user = User(**user)
 
-    for k, v in asdict(
+    for k, v in shallow_asdict(
         UserSession(
             login=user.login,
             id=user.id,
@@ -267,7 +267,7 @@ async def register_webauthn_options():
     if "id" not in session:
         request_data = Authentication(**request.form_parsed)
         async with db:
-            user = await db.search("users", {"login": request_data.login})
+            user = await db.search("users", {"login": request_data.login}, limit=1)
 
         if user:
             return "User is not available", 409
@@ -310,14 +310,14 @@ async def auth_login_verify():
         if not login_opts:
             return "Timeout exceeded", 409
 
-        credential_id = b64url_decode(auth_response["rawId"])
+        credential_id = b64url_decode(auth_response["rawId"]).hex()
         user_id = b64url_decode(auth_response["response"]["userHandle"]).decode("utf-8")
 
         async with db:
             user = await db.search(
                 "users",
                 {
-                    "credentials.id": credential_id.hex(),
+                    "credentials.id": credential_id,
                     "id": user_id,
                 },
             )
@@ -325,10 +325,10 @@ async def auth_login_verify():
         if not user:
             return "Unknown passkey", 409
 
-        user = User(**user[0])
+        user = User.from_document(user[0])
 
         for credential in user.credentials:
-            if credential.id == credential_id.hex():
+            if credential.id == credential_id:
                 if not credential.active:
                     return "Passkey is disabled", 409
                 matched_user_credential = credential
@@ -346,17 +346,16 @@ async def auth_login_verify():
         if not user.active:
             return "User is not allowed to sign in", 409
 
-        for credential in user.credentials:
-            if credential.id == credential_id.hex():
-                credential.last_login = utc_now_as_str()
-                if verification["counter_supported"] != 0:
-                    matched_user_credential.sign_count = verification["sign_count"]
-                break
-
-        user_dict = asdict(user)
+        matched_user_credential.last_login = utc_now_as_str()
+        if verification["counter_supported"] != 0:
+            matched_user_credential.sign_count = verification["sign_count"]
 
         async with db:
-            await db.patch("users", user_id, {"credentials": user_dict["credentials"]})
+            await db.patch(
+                "users",
+                user_id,
+                {"credentials": [shallow_asdict(c) for c in user.credentials]},
+            )
 
     except Exception as e:
         logger.error(f"Login error: {e}", exc_info=True)
@@ -369,19 +368,19 @@ async def auth_login_verify():
             request_token,
             {
                 "status": "confirmed",
-                "credential_id": credential_id.hex(),
+                "credential_id": credential_id,
             },
             5,
         )
         session.pop("request_token", None)
         return "", 202
 
-    for k, v in asdict(
+    for k, v in shallow_asdict(
         UserSession(
             login=user.login,
             id=user.id,
             acl=user.acl,
-            cred_id=credential_id.hex(),
+            cred_id=credential_id,
             lang=request.accept_languages.best_match(defaults.ACCEPT_LANGUAGES),
             profile=user.profile,
         )
@@ -438,12 +437,14 @@ async def register_webauthn():
                     "credentials": [new_credential],
                 }
             )
-            await db.upsert("users", user_id, asdict(user))
+            await db.upsert("users", user_id, shallow_asdict(user))
         else:
-            user = await db.get("users", user_id)
-            user = User(**user)
+            user = User.from_document(await db.get("users", user_id))
             user.credentials.append(new_credential)
-            user_dict = asdict(user)
-            await db.patch("users", user_id, {"credentials": user_dict["credentials"]})
+            await db.patch(
+                "users",
+                user_id,
+                {"credentials": [shallow_asdict(c) for c in user.credentials]},
+            )
 
     return "", 204
@@ -26,6 +26,7 @@ async def user_group():
             if assignment not in all_assignments:
                 all_assignments.append(assignment)
 
+        changes = {}
         for user_dict in all_assignments:
             if "groups" not in user_dict:
                 user_dict["groups"] = []
@@ -39,7 +40,9 @@ async def user_group():
             ):
                 user_dict["groups"].append(user_groups.new_name)
 
-            await db.patch("users", user_dict["id"], {"groups": user_dict["groups"]})
+            changes[user_dict["id"]] = {"groups": user_dict["groups"]}
+
+        await db.patch_many("users", changes)
 
     return "", 204
 
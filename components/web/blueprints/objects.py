@@ -1,4 +1,5 @@
-from components.utils.misc import ensure_list, unique_list
+import asyncio
+from components.utils.misc import ensure_list
 from quart import Blueprint, abort, render_template, request, session
 from components.web.utils.wrappers import acl, formoptions
 from components.web.utils.notifications import trigger_notification
@@ -6,7 +7,7 @@ from components.web.utils.utils import render_or_json
 from components.web.utils.tables import table_search_helper
 from components.database import db
 from components.models.objects import model_meta
-from dataclasses import asdict
+from components.models.helpers import shallow_asdict
 
 blueprint = Blueprint("objects", __name__, url_prefix="/objects")
 
@@ -33,14 +34,18 @@ async def before_request():
         )
         object_type = request.view_args["object_type"]
         async with db:
-            for id_ in object_ids:
-                match = await db.get(object_type, id_)
+            matches = await asyncio.gather(
+                *(db.get(object_type, id_) for id_ in object_ids)
+            )
+            model = model_meta["objects"]["base"][object_type]
+            system_fields = model_meta["objects"]["system_fields"][object_type]
+            session_id = session["id"]
+            is_system = "system" in session["acl"]
+            for id_, match in zip(object_ids, matches):
                 if match:
-                    model = model_meta["objects"]["base"][object_type]
-                    match = model(**match)
+                    match = model.from_document(match)
                 if not match or (
-                    session["id"] not in match.assigned_users
-                    and "system" not in session["acl"]
+                    session_id not in match.assigned_users and not is_system
                 ):
                     if "Hx-Request" in request.headers:
                         return trigger_notification(
@@ -51,8 +56,8 @@ async def before_request():
                         )
                     abort(404)
 
-                if "system" not in session["acl"]:
-                    for f in model_meta["objects"]["system_fields"][object_type]:
+                if not is_system:
+                    for f in system_fields:
                         if hasattr(match, f):
                             setattr(match, f, None)
 
@@ -135,31 +140,39 @@ async def create_object(object_type: str):
     upsert_data = upsert_model(**request.form_parsed)
 
     async with db:
-        _unique_hits = await db.search(
+        unique_search = db.search(
             object_type,
             {
                 f: getattr(upsert_data, f)
                 for f in model_meta["objects"]["unique_fields"][object_type]
             },
         )
+        if hasattr(upsert_data, "assigned_project") and upsert_data.assigned_project:
+            _unique_hits, _project_hits = await asyncio.gather(
+                unique_search,
+                db.search(
+                    "projects",
+                    where=(
+                        {
+                            "assigned_users": session["id"],
+                            "id": upsert_data.assigned_project,
+                        }
+                        if "system" not in session["acl"]
+                        else {"id": upsert_data.assigned_project}
+                    ),
+                ),
+            )
+        else:
+            _unique_hits = await unique_search
+            _project_hits = None
+
         if _unique_hits:
             raise ValueError("name", "Object exists")
 
-        if hasattr(upsert_data, "assigned_project") and upsert_data.assigned_project:
-            if not await db.search(
-                "projects",
-                where=(
-                    {
-                        "assigned_users": session["id"],
-                        "id": upsert_data.assigned_project,
-                    }
-                    if "system" not in session["acl"]
-                    else {"id": upsert_data.assigned_project}
-                ),
-            ):
-                raise ValueError("assigned_project", "Project is not accessible")
+        if _project_hits is not None and not _project_hits:
+            raise ValueError("assigned_project", "Project is not accessible")
 
-        await db.upsert(object_type, upsert_data.id, asdict(upsert_data))
+        await db.upsert(object_type, upsert_data.id, shallow_asdict(upsert_data))
         display_attr = model_meta["objects"]["display_attr"].get(object_type, "name")
 
     return trigger_notification(
@@ -176,16 +189,21 @@ async def delete_object(object_type: str, object_id: str | None = None):
     object_ids = request._objects.keys()
 
     async with db:
-        for id_ in object_ids:
-            if object_type == "projects":
-                for res in await db.search(
-                    "cars",
-                    where={
-                        "assigned_project": id_,
-                    },
-                ):
-                    await db.patch("cars", res["id"], {"assigned_project": None})
+        if object_type == "projects" and object_ids:
+            await db.patch_many(
+                "cars",
+                {
+                    res["id"]: {"assigned_project": None}
+                    for res in await db.search(
+                        "cars",
+                        where={
+                            "assigned_project": list(object_ids),
+                        },
+                    )
+                },
+            )
 
+        for id_ in object_ids:
             await db.delete(object_type, id_)
 
     return trigger_notification(
@@ -207,20 +225,18 @@ async def patch_object(object_type: str, object_id: str | None = None):
             if hasattr(patch_data, f):
                 setattr(patch_data, f, None)
 
+    unique_fields = model_meta["objects"]["unique_fields"][object_type]
+    accessible_projects = None
+
     async with db:
         for id_ in object_ids:
             patched_object = patch_data.merge(request._objects[id_])
 
             # Check for uniqueness
-            unique_filters = {
-                f: getattr(patched_object, f)
-                for f in model_meta["objects"]["unique_fields"][object_type]
-            }
+            unique_filters = {f: getattr(patched_object, f) for f in unique_fields}
             _unique_hits = await db.search(object_type, unique_filters)
             if _unique_hits and _unique_hits[0]["id"] != id_:
-                raise ValueError(
-                    model_meta["objects"]["unique_fields"][object_type], "Object exists"
-                )
+                raise ValueError(unique_fields, "Object exists")
 
             # Check for project access
             if "system" not in session["acl"]:
@@ -228,28 +244,24 @@ async def patch_object(object_type: str, object_id: str | None = None):
                     hasattr(patch_data, "assigned_project")
                     and patch_data.assigned_project
                 ):
+                    # Resolve the user's projects once for all patched objects
+                    if accessible_projects is None:
+                        accessible_projects = {
+                            p["id"]
+                            for p in await db.search(
+                                "projects",
+                                where={"assigned_users": session["id"]},
+                            )
+                        }
+
+                    _projects = {patch_data.assigned_project}
                     if request._objects[id_].assigned_project:
-                        _projects = unique_list(
-                            [
-                                patch_data.assigned_project,
-                                request._objects[id_].assigned_project,
-                            ]
-                        )
-                    else:
-                        _projects = [patched_object.assigned_project]
-
-                    _project_hits = await db.search(
-                        "projects",
-                        where={
-                            "assigned_users": session["id"],
-                            "id": _projects,
-                        },
-                    )
+                        _projects.add(request._objects[id_].assigned_project)
 
-                    if set([p["id"] for p in _project_hits]) != set(_projects):
+                    if not _projects <= accessible_projects:
                         raise ValueError("name", "Project is not accessible")
 
-            await db.patch(object_type, id_, asdict(patched_object))
+            await db.patch(object_type, id_, patch_data.dump_merged(patched_object))
 
     return trigger_notification(
         level="success",
@@ -56,7 +56,7 @@ async def get_incomplete():
         )
 
         rows["items"] = [
-            Processing(**await db.get("processings", item["id"]))
+            Processing.from_document(await db.get("processings", item["id"]))
             for item in rows["items"]
         ]
 
@@ -79,7 +79,7 @@ async def finalize_processing(processing_id):
             message="Processing not found",
         )
 
-    processing_data = Processing(**processing)
+    processing_data = Processing.from_document(processing)
 
     async with db:
         await db.delete("processings", processing_data.id)
@@ -109,28 +109,34 @@ async def finalize_processing(processing_id):
 @formoptions(["projects"])
 async def process_upload():
     async def _task(file_bytes, filename):
-        vin_extractor = await VINExtractor.get_extractor_for_filename(filename)
+        vin_extractor = await VINExtractor.get_extractor_for_filename(
+            filename, settings
+        )
         if not vin_extractor:
             return
 
         results = await vin_extractor.extract(file_bytes, filename=filename)
 
+        processings = [
+            ProcessingAdd(
+                **{
+                    "vin": result.vin,
+                    "location": None,
+                    "metadata": result.metadata,
+                    "assigned_user": session["id"],
+                    "assets": [result.asset] if result.asset else [],
+                }
+            )
+            for result in results
+        ]
+        if not processings:
+            return
+
         async with db:
-            for result in results:
-                processing_data = ProcessingAdd(
-                    **{
-                        "vin": result.vin,
-                        "location": None,
-                        "metadata": result.metadata,
-                        "assigned_user": session["id"],
-                        "assets": [result.asset] if result.asset else [],
-                    }
-                )
-                await db.upsert(
-                    "processings",
-                    processing_data.id,
-                    asdict(processing_data),
-                )
+            await db.upsert_many(
+                "processings",
+                {p.id: asdict(p) for p in processings},
+            )
 
     files = await request.files
     form = await request.form
@@ -145,24 +151,22 @@ async def process_upload():
     if not image_files and not data_files and not text_data:
         raise ValueError(["images", "files", "text_data"], "No files or text provided")
 
+    # Load the extractor settings once for all uploaded files
+    settings = await VINExtractor.load_settings()
+    user_tasks = STATE.queued_user_tasks[session["id"]]
+
+    def _queue(file_bytes, filename):
+        t = asyncio.create_task(_task(file_bytes, filename))
+        user_tasks.add(t)
+        t.add_done_callback(user_tasks.discard)
+
     # Process file uploads
-    for file in image_files:
-        file_bytes = file.read()
-        t = asyncio.create_task(_task(file_bytes, file.filename))
-        STATE.queued_user_tasks[session["id"]].add(t)
-        t.add_done_callback(STATE.queued_user_tasks[session["id"]].discard)
-    for file in data_files:
-        file_bytes = file.read()
-        t = asyncio.create_task(_task(file_bytes, file.filename))
-        STATE.queued_user_tasks[session["id"]].add(t)
-        t.add_done_callback(STATE.queued_user_tasks[session["id"]].discard)
+    for file in (*image_files, *data_files):
+        _queue(file.read(), file.filename)
 
     # Process text input as virtual text/plain file
     if text_data:
-        text_bytes = text_data.encode("utf-8")
-        t = asyncio.create_task(_task(text_bytes, "user_text.txt"))
-        STATE.queued_user_tasks[session["id"]].add(t)
-        t.add_done_callback(STATE.queued_user_tasks[session["id"]].discard)
+        _queue(text_data.encode("utf-8"), "user_text.txt")
 
     return await render_template(
         "processings/tasks.html", processings_count=len(db.ids("processings"))
@@ -175,7 +179,6 @@ async def process_upload():
 async def get_processing(processing_id):
     async with db:
         processing = await db.get("processings", processing_id)
-        processing = Processing(**processing)
     if not processing:
         return trigger_notification(
             level="error",
@@ -184,4 +187,7 @@ async def get_processing(processing_id):
             message="Processing not found",
         )
 
-    return await render_template("processings/processing.html", processing=processing)
+    return await render_template(
+        "processings/processing.html",
+        processing=Processing.from_document(processing),
+    )
@@ -4,7 +4,7 @@ from components.web.utils.notifications import trigger_notification
 from components.database import db
 from components.models.users import User
 from components.models.profile import UserProfilePatch
-from dataclasses import asdict
+from components.models.helpers import shallow_asdict
 
 
 blueprint = Blueprint("profile", __name__, url_prefix="/profile")
@@ -34,10 +34,9 @@ async def user_profile_patch():
     patch_data = UserProfilePatch(**request.form_parsed)
 
     async with db:
-        user = await db.get("users", session["id"])
-        user = User(**user)
+        user = User.from_document(await db.get("users", session["id"]))
         user.profile = patch_data.merge(user.profile)
-        profile_dict = asdict(user.profile)
+        profile_dict = shallow_asdict(user.profile)
 
         trigger = {}
         if session["profile"]["vault"] != profile_dict["vault"]:
@@ -7,13 +7,12 @@ from components.cluster import cluster
 from components.database import db
 from components.models.system import SystemSettings, SystemSettingsPatch
 from components.utils.datetimes import datetime
-from components.utils.misc import batch
 from components.utils.vins.plugins import EXTRACTORS
 from components.web.utils.notifications import trigger_notification
 from components.web.utils.tables import table_search_helper
 from components.web.utils.utils import ws_hyperscript
 from components.web.utils.wrappers import acl
-from dataclasses import asdict, replace
+from dataclasses import asdict
 from quart import Blueprint, render_template, request, session
 
 blueprint = Blueprint("system", __name__, url_prefix="/system")
@@ -56,7 +55,7 @@ async def write_settings():
         system_settings = await db.get("system_settings", "1")
         if system_settings:
             system_settings = SystemSettings(**system_settings)
-            system_settings = replace(system_settings, **patch_data.dump_patched())
+            system_settings = patch_data.merge(system_settings)
             system_settings_dict = asdict(system_settings)
             await db.patch("system_settings", "1", system_settings_dict)
         else:
@@ -147,24 +146,13 @@ async def cluster_logs():
                     d["record"]["time"]["repr"]
                 ).timestamp()
 
-        log_pages = [
-            m
-            for m in batch(
-                sorted(
-                    _logs,
-                    key=system_logs_sort_func(sort_attr),
-                    reverse=sort_reverse,
-                ),
-                page_size,
-            )
-        ]
+        _logs.sort(key=system_logs_sort_func(sort_attr), reverse=sort_reverse)
 
-        try:
-            log_pages[page - 1]
-        except IndexError:
-            page = len(log_pages)
+        total_pages = -(-len(_logs) // page_size)
+        page = min(page, total_pages)
 
-        system_logs = log_pages[page - 1] if page else log_pages
+        start = (page - 1) * page_size
+        system_logs = _logs[start : start + page_size] if page > 0 else []
 
         return await render_template(
             "system/includes/logs/table_body.html",
@@ -172,7 +160,7 @@ async def cluster_logs():
                 "logs": system_logs,
                 "page_size": page_size,
                 "page": page,
-                "total_pages": len(log_pages),
+                "total_pages": total_pages,
                 "total": len(_logs),
             },
         )
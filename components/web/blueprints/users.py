@@ -9,7 +9,7 @@ from components.models.users import USER_ACLS, User, UserPatch
 from components.models.profile import UserProfilePatch
 from components.models.credentials import CredentialPatch
 from components.utils.misc import ensure_list
-from dataclasses import asdict
+from components.models.helpers import shallow_asdict
 
 
 blueprint = Blueprint("users", __name__, url_prefix="/users")
@@ -29,7 +29,7 @@ async def get_user(user_id: str):
     async with db:
         user = await db.get("users", user_id)
         if user:
-            user = User(**user)
+            user = User.from_document(user)
         else:
             if "Hx-Request" in request.headers:
                 return trigger_notification(
@@ -75,6 +75,7 @@ async def get_users():
 @blueprint.route("/<user_id>", methods=["DELETE"])
 @acl("system")
 async def delete_user(user_id: str | None = None):
+    user_ids = user_id
     if request.method == "POST":
         user_ids = request.form_parsed.get("id")
 
@@ -83,7 +84,7 @@ async def delete_user(user_id: str | None = None):
         for user_id in ensure_list(user_ids):
             if user_id == session["id"]:
                 raise ValueError("user_id", "Cannot remove this user")
-            if not db.get("users", user_id):
+            if not db.exists("users", user_id):
                 raise ValueError("user_id", "User is not available")
             delete_ids.add(user_id)
         for delete_id in delete_ids:
@@ -106,7 +107,7 @@ async def patch_user_credential(user_id: str, hex_id: str):
     async with db:
         user = await db.get("users", user_id)
         if user:
-            user = User(**user)
+            user = User.from_document(user)
         else:
             if "Hx-Request" in request.headers:
                 return trigger_notification(
@@ -117,26 +118,26 @@ async def patch_user_credential(user_id: str, hex_id: str):
                 )
             abort(404)
 
-        for credential in user.credentials:
-            if credential.id == hex_id:
-                user.credentials.remove(credential)
-                patch_data = CredentialPatch(**request.form_parsed)
-                patched_credential = patch_data.merge(credential)
-                user.credentials.append(patched_credential)
-                user_dict = asdict(user)
+        credentials = {c.id: c for c in user.credentials}
+        credential = credentials.get(hex_id)
+        if credential is None:
+            raise ValueError("hex_id", "Unknown passkey")
 
-                await db.patch(
-                    "users", user_id, {"credentials": user_dict["credentials"]}
-                )
+        patch_data = CredentialPatch(**request.form_parsed)
+        credentials[hex_id] = patch_data.merge(credential)
 
-                return trigger_notification(
-                    level="success",
-                    response_code=204,
-                    title="Completed",
-                    message="Passkey modified",
-                )
+        await db.patch(
+            "users",
+            user_id,
+            {"credentials": [shallow_asdict(c) for c in credentials.values()]},
+        )
 
-    raise ValueError("hex_id", "Unknown passkey")
+    return trigger_notification(
+        level="success",
+        response_code=204,
+        title="Completed",
+        message="Passkey modified",
+    )
 
 
 @blueprint.route("/<user_id>/credential/<hex_id>", methods=["DELETE"])
@@ -148,7 +149,7 @@ async def delete_user_credential(user_id: str, hex_id: str):
     async with db:
         user = await db.get("users", user_id)
         if user:
-            user = User(**user)
+            user = User.from_document(user)
         else:
             if "Hx-Request" in request.headers:
                 return trigger_notification(
@@ -160,9 +161,12 @@ async def delete_user_credential(user_id: str, hex_id: str):
             abort(404)
 
         user.credentials = [c for c in user.credentials if c.id != hex_id]
-        user_dict = asdict(user)
 
-        await db.patch("users", user_id, {"credentials": user_dict["credentials"]})
+        await db.patch(
+            "users",
+            user_id,
+            {"credentials": [shallow_asdict(c) for c in user.credentials]},
+        )
 
     return trigger_notification(
         level="success",
@@ -184,12 +188,11 @@ async def patch_user(user_id: str | None = None):
     profile_patch_data = UserProfilePatch(**profile_form)
 
     async with db:
-        user = await db.get("users", user_id)
-        user = User(**user)
+        user = User.from_document(await db.get("users", user_id))
         user_profile = profile_patch_data.merge(user.profile)
         user = user_patch_data.merge(user)
         user.profile = user_profile
-        await db.patch("users", user_id, asdict(user))
+        await db.patch("users", user_id, shallow_asdict(user))
 
     STATE.session_validated.pop(user_id, None)
 
@@ -1,2 +1,2 @@
 FORM_OPTIONS_CACHE = {}
-FORM_OPTIONS_TABLE_VERSIONS = {}
+FORM_OPTIONS_DOC_VERSIONS = {}
@@ -1,7 +1,7 @@
 import json
 
 from quart import request
-from components.utils.lang import LANG
+from components.utils.lang import t
 from components.logs import logger
 
 
@@ -44,8 +44,8 @@ def trigger_notification(
                 {
                     "notification": {
                         "level": level,
-                        "title": LANG[request.USER_LANG][title],
-                        "message": LANG[request.USER_LANG][message].format(
+                        "title": t(request.USER_LANG, title),
+                        "message": t(request.USER_LANG, message).format(
                             *message_params
                         ),
                         "duration": duration,
@@ -1,7 +1,7 @@
 from quart import render_template, request, current_app
 from components.database import db
 from components.database.states import STATE
-from components.models.users import USER_ACLS
+from components.models.users import USER_ACLS_SET
 from components.utils.datetimes import utc_now_as_str
 from dataclasses import asdict, is_dataclass
 from werkzeug.datastructures import ImmutableMultiDict
@@ -30,7 +30,7 @@ def build_nested_dict(multi_dict: ImmutableMultiDict) -> dict:
 
 
 async def ws_hyperscript(channel, data, if_path: str = "", exclude_self: bool = False):
-    if channel.startswith("@") and channel.lstrip("@") in USER_ACLS:
+    if channel.startswith("@") and channel.lstrip("@") in USER_ACLS_SET:
         channel = channel.removeprefix("@")
         async with db:
             users = await db.search(
@@ -3,13 +3,15 @@ from quart import redirect, request, session, url_for, websocket
 from components.database import db
 from components.database.states import STATE
 from components.logs import logger
-from components.models.users import User, USER_ACLS, UserSession
+from components.models.users import User, USER_ACLS_SET, UserSession
 from components.models.objects import model_meta
-from components.utils.misc import ensure_list, unique_list
+from components.utils.misc import ensure_unique_list
 from config import defaults
 from functools import wraps
 from dataclasses import asdict
-from .cache import FORM_OPTIONS_CACHE, FORM_OPTIONS_TABLE_VERSIONS
+from .cache import FORM_OPTIONS_CACHE, FORM_OPTIONS_DOC_VERSIONS
+
+SESSION_ACLS = USER_ACLS_SET | {"any"}
 
 
 class AuthException(Exception):
@@ -35,28 +37,31 @@ def session_clear(preserved_keys: list = []) -> None:
 
 
 async def verify_session(acl: str | list) -> None:
-    acls = unique_list(ensure_list(acl))
+    acls = ensure_unique_list(acl)
 
-    if not session.get("id"):
+    # Resolve the session proxy once instead of on every ACL check
+    session_id = session.get("id")
+    if not session_id:
         raise AuthException("Session ID missing")
 
-    if not all(item in [*USER_ACLS, "any"] for item in acls):
+    if not SESSION_ACLS.issuperset(acls):
         raise AuthException("Unknown ACL")
 
-    for acl in acls:
-        if session["id"] not in STATE.session_validated:
-            async with db:
-                user = await db.get("users", session["id"])
+    if acls and session_id not in STATE.session_validated:
+        async with db:
+            user = await db.get("users", session_id)
 
-            if not user:
-                session_clear()
-                raise AuthException("User unknown")
+        if not user:
+            session_clear()
+            raise AuthException("User unknown")
 
-            user = User(**user)
-            STATE.session_validated.update({session["id"]: user.acl})
-            session["acl"] = user.acl
+        user = User.from_document(user)
+        STATE.session_validated.update({session_id: user.acl})
+        session["acl"] = user.acl
 
-        if acl == "any" or acl in STATE.session_validated[session["id"]]:
+    validated_acls = STATE.session_validated.get(session_id, ())
+    for acl in acls:
+        if acl == "any" or acl in validated_acls:
             break
     else:
         raise AuthException("Access denied by ACL")
@@ -88,7 +93,7 @@ async def create_session_by_token(token):
         session_clear()
         raise AuthException("User unknown")
 
-    user = User(**user[0])
+    user = User.from_document(user[0])
 
     if token_value not in user.profile.access_tokens:
         raise AuthException("Token invalid")
@@ -179,43 +184,70 @@ def acl(acl_type):
     return check_acl
 
 
+async def _form_option_rows(option: str) -> dict:
+    doc_versions = db.doc_versions(option)
+    cached_versions = FORM_OPTIONS_DOC_VERSIONS.get(option)
+    rows = FORM_OPTIONS_CACHE.get(option)
+
+    if rows is None or cached_versions is None:
+        async with db:
+            rows_result = await db.list_rows(option, page_size=-1)
+        rows = {row["id"]: row for row in rows_result["items"]}
+
+    elif cached_versions != doc_versions:
+        # Only reload rows whose document changed since the cache was filled
+        rows = {
+            id_: row
+            for id_, row in rows.items()
+            if id_ in doc_versions or id_ not in cached_versions
+        }
+        stale_ids = [
+            id_
+            for id_, version in doc_versions.items()
+            if cached_versions.get(id_) != version
+        ]
+        if stale_ids:
+            async with db:
+                for row in await db.get_rows(option, stale_ids):
+                    rows[row["id"]] = row
+            # Keep the id order list_rows uses when filling the cache
+            rows = dict(sorted(rows.items()))
+
+    else:
+        return rows
+
+    FORM_OPTIONS_CACHE[option] = rows
+    FORM_OPTIONS_DOC_VERSIONS[option] = doc_versions
+    return rows
+
+
 def formoptions(options: list):
     def inject_options(fn):
         @wraps(fn)
         async def wrapper(*args, **kwargs):
             request.form_options = dict()
+            # Read the session once, not once per option and row
+            session_id = session.get("id")
+            is_system = "system" in session["acl"]
 
             for option in options:
-                if option == "users" and "system" not in session["acl"]:
+                if option == "users" and not is_system:
                     continue
 
-                rows = None
-                table_version = db.table_version(option)
-                cached_version = FORM_OPTIONS_TABLE_VERSIONS.get(option)
-
-                if cached_version is not None and cached_version == table_version:
-                    rows = FORM_OPTIONS_CACHE.get(option)
-
-                if rows is None:
-                    async with db:
-                        rows_result = await db.list_rows(option, page_size=-1)
-                    rows = rows_result["items"]
-                    FORM_OPTIONS_CACHE[option] = rows
-                    FORM_OPTIONS_TABLE_VERSIONS[option] = table_version
+                rows = await _form_option_rows(option)
 
                 if option == "users":
-                    request.form_options[option] = {row["id"]: row for row in rows}
+                    request.form_options[option] = dict(rows)
 
                 elif option in model_meta["objects"]["types"]:
-                    request.form_options[option] = {row["id"]: row for row in rows}
-
-                    for k, v in request.form_options[option].items():
-                        request.form_options[option][k]["permitted"] = False
-                        if (
-                            "system" in session["acl"]
-                            or session["id"] in v["assigned_users"]
-                        ):
-                            request.form_options[option][k]["permitted"] = True
+                    # Copy the shared cached rows before flagging them per session
+                    request.form_options[option] = {
+                        k: {
+                            **v,
+                            "permitted": is_system or session_id in v["assigned_users"],
+                        }
+                        for k, v in rows.items()
+                    }
 
             return await fn(*args, **kwargs)
 
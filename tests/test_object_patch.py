@@ -0,0 +1,38 @@
+from components.models.objects import ObjectCar, ObjectPatchCar
+
+USER_ID = "0b8f1c52-6f6e-4d55-9c1e-3f0c5a2e7d10"
+
+CAR_DOC = {
+    "id": "5d7a9e0c-2b1f-4c3e-8a6d-9f4b2c1e0a7b",
+    "created": "2026-01-01T00:00:00+0000",
+    "updated": "2026-01-01T00:00:00+0000",
+    "doc_version": 1,
+    "vin": "1HGBH41JXMN109186",
+    "assigned_users": [USER_ID],
+    "notes": "old",
+}
+
+
+def test_patch_by_non_system_user_does_not_write_system_fields():
+    car = ObjectCar.from_document(dict(CAR_DOC))
+    # The objects blueprint blanks system fields for non-system users
+    car.assigned_users = None
+
+    patch = ObjectPatchCar(notes="new", assigned_users=[USER_ID])
+    patch.assigned_users = None
+
+    changes = patch.dump_merged(patch.merge(car))
+
+    assert "assigned_users" not in changes
+    assert changes["notes"] == "new"
+    assert "updated" in changes
+
+
+def test_patch_by_system_user_writes_validated_assigned_users():
+    car = ObjectCar.from_document(dict(CAR_DOC))
+    patch = ObjectPatchCar(assigned_users=USER_ID)
+
+    changes = patch.dump_merged(patch.merge(car))
+
+    assert changes["assigned_users"] == [USER_ID]
+    assert car.assigned_users == [USER_ID]